@@ -23,6 +23,10 @@ router = APIRouter(prefix="/api/v1/provider", tags=["Provider Authentication"])
 # Initialize service
 auth_service = AuthService()
 
+def get_auth_service() -> AuthService:
+    """Provide the shared AuthService; tests replace it through app.dependency_overrides."""
+    return auth_service
+
 @router.post(
     "/login",
     response_model=LoginSuccessResponseSchema,
@@ -111,7 +115,7 @@ auth_service = AuthService()
         }
     }
 )
-async def login_provider(login_data: ProviderLoginSchema):
+async def login_provider(login_data: ProviderLoginSchema, auth_service: AuthService = Depends(get_auth_service)):
     """
     Authenticate provider and generate JWT access token.
     
@@ -208,7 +212,7 @@ async def login_provider(login_data: ProviderLoginSchema):
         401: {"description": "Invalid refresh token"}
     }
 )
-async def refresh_token(body: Dict[str, Any]):
+async def refresh_token(body: Dict[str, Any], auth_service: AuthService = Depends(get_auth_service)):
     try:
         refresh_token = body.get("refresh_token")
         if not refresh_token:
@@ -1,9 +1,12 @@
+import functools
 import os
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Generator, Optional
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from pymongo import MongoClient
 from pymongo.database import Database
 from pymongo.collection import Collection
@@ -18,6 +21,58 @@ from app.models.nosql_models import ProviderDocument, ProviderAvailabilityDocume
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection-level tuning for SQLite: WAL journaling lets readers proceed during
+# writes, and synchronous=NORMAL avoids an fsync on every commit under WAL.
+# The trade-off is that the last few commits may be lost on power failure or an
+# OS crash (never on an application crash); the database itself stays consistent.
+# WAL leaves -wal and -shm files next to the database file.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+def apply_sqlite_pragmas(dbapi_connection) -> None:
+    """Apply SQLITE_PRAGMAS to a raw sqlite3 connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+class StaleConnectionError(Exception):
+    """Raised when a pooled connection turns out to be dead so the caller can retry."""
+
+# Set while a retry_on_disconnect-wrapped call is on its first attempt
+_retry_on_disconnect: ContextVar[bool] = ContextVar("retry_on_disconnect", default=False)
+
+def retry_on_disconnect(func):
+    """
+    Retry an async read operation once if its pooled connection was dead.
+    
+    SQLite engines do not ping connections on checkout, so a dead connection
+    is only noticed when a query fails. SQLAlchemy invalidates the pool at
+    that point, and the second attempt runs on a fresh connection. Server
+    database engines ping on checkout, which covers writes as well.
+    Failures on the second attempt are handled by the wrapped function as usual.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _retry_on_disconnect.set(True)
+        try:
+            return await func(*args, **kwargs)
+        except StaleConnectionError as e:
+            logger.warning(f"Database connection was lost, retrying {func.__name__}: {str(e)}")
+        finally:
+            _retry_on_disconnect.reset(token)
+        
+        return await func(*args, **kwargs)
+    
+    return wrapper
+
 class DatabaseManager:
     """
     Manages database connections for both SQL and NoSQL databases.
@@ -27,6 +82,8 @@ class DatabaseManager:
         self.database_type = config.DATABASE_TYPE
         self._sql_engine = None
         self._sql_session_factory = None
+        self._sql_read_engine = None
+        self._sql_read_session_factory = None
         self._mongo_client = None
         self._mongo_database = None
         self._initialized = False
@@ -44,24 +101,9 @@ class DatabaseManager:
             # For development, use SQLite if other databases are not available
             if "localhost" in database_url and not self._check_database_connection(database_url):
                 logger.warning(f"Cannot connect to {self.database_type}, falling back to SQLite")
-                database_url = "sqlite:///./healthfirst.db"
+                database_url = config.SQLITE_URL
             
-            self._sql_engine = create_engine(
-                database_url,
-                echo=config.DEBUG,
-                pool_pre_ping=True,
-                pool_recycle=300
-            )
-            
-            # Create tables
-            Base.metadata.create_all(bind=self._sql_engine)
-            
-            # Create session factory
-            self._sql_session_factory = sessionmaker(
-                bind=self._sql_engine,
-                autocommit=False,
-                autoflush=False
-            )
+            self._configure_sql_engines(database_url, pool_recycle=300)
             
             logger.info(f"SQL database initialized successfully with {database_url}")
             
@@ -70,15 +112,61 @@ class DatabaseManager:
             # Fall back to SQLite for development
             try:
                 logger.info("Attempting SQLite fallback...")
-                database_url = "sqlite:///./healthfirst.db"
-                self._sql_engine = create_engine(database_url, echo=config.DEBUG)
-                Base.metadata.create_all(bind=self._sql_engine)
-                self._sql_session_factory = sessionmaker(bind=self._sql_engine, autocommit=False, autoflush=False)
+                database_url = config.SQLITE_URL
+                self._configure_sql_engines(database_url)
                 logger.info("SQLite fallback successful")
             except Exception as fallback_error:
                 logger.error(f"SQLite fallback also failed: {str(fallback_error)}")
                 raise
     
+    def _create_sql_engine(self, database_url: str, **kwargs) -> Engine:
+        """Create a SQLAlchemy engine, tuning SQLite connections as they are opened."""
+        engine = create_engine(database_url, echo=config.DEBUG, **kwargs)
+        
+        if engine.dialect.name == "sqlite":
+            event.listen(engine, "connect", lambda dbapi_connection, _: apply_sqlite_pragmas(dbapi_connection))
+        
+        return engine
+    
+    def _configure_sql_engines(self, database_url: str, **kwargs):
+        """
+        Create the SQL engines, tables and session factories.
+        
+        SQLite allows a single writer at a time, so it gets a one-connection
+        write pool and a separate read pool; read bursts then cannot exhaust
+        the pool that writers depend on. Server databases share one engine.
+        
+        A local SQLite connection cannot be dropped by a server, so its engines
+        skip the SELECT 1 ping on checkout and rely on retry_on_disconnect.
+        Server database engines keep the ping: a restart or failover would
+        otherwise fail the first write on each stale pooled connection.
+        """
+        if database_url.startswith("sqlite"):
+            self._sql_engine = self._create_sql_engine(
+                database_url, pool_size=1, max_overflow=0, pool_pre_ping=False, **kwargs
+            )
+            self._sql_read_engine = self._create_sql_engine(
+                database_url, pool_size=(os.cpu_count() or 1) * 2, pool_pre_ping=False, **kwargs
+            )
+        else:
+            self._sql_engine = self._create_sql_engine(database_url, pool_pre_ping=True, **kwargs)
+            self._sql_read_engine = self._sql_engine
+        
+        # Create tables
+        Base.metadata.create_all(bind=self._sql_engine)
+        
+        # Create session factories
+        self._sql_session_factory = sessionmaker(
+            bind=self._sql_engine,
+            autocommit=False,
+            autoflush=False
+        )
+        self._sql_read_session_factory = sessionmaker(
+            bind=self._sql_read_engine,
+            autocommit=False,
+            autoflush=False
+        )
+    
     def _check_database_connection(self, database_url: str) -> bool:
         """Check if database is accessible."""
         try:
@@ -166,6 +254,9 @@ class DatabaseManager:
         """
         Get SQL database session with automatic cleanup.
         
+        Sessions are bound to the write engine; use get_read_session() for
+        queries that do not modify data.
+        
         Yields:
             SQLAlchemy session
         """
@@ -182,6 +273,33 @@ class DatabaseManager:
         finally:
             session.close()
     
+    get_write_session = get_sql_session
+    
+    @contextmanager
+    def get_read_session(self) -> Generator[Session, None, None]:
+        """
+        Get read-only SQL database session bound to the read engine.
+        
+        Inside a retry_on_disconnect-wrapped call, a query that fails because
+        its connection was dead raises StaleConnectionError instead.
+        
+        Yields:
+            SQLAlchemy session
+        """
+        if not self._sql_read_session_factory:
+            raise RuntimeError("SQL database not initialized")
+        
+        session = self._sql_read_session_factory()
+        try:
+            yield session
+        except OperationalError as e:
+            if e.connection_invalidated and _retry_on_disconnect.get():
+                raise StaleConnectionError(str(e)) from e
+            raise
+        finally:
+            session.rollback()
+            session.close()
+    
     def get_mongo_collection(self, collection_name: str) -> Collection:
         """
         Get MongoDB collection.
@@ -213,12 +331,30 @@ class DatabaseManager:
         """Get the appointment slots collection from MongoDB."""
         return self.get_mongo_collection("appointment_slots")
     
+    def get_sqlite_path(self) -> Optional[str]:
+        """Return the database file path when running on SQLite, otherwise None."""
+        if not self._sql_engine or self._sql_engine.dialect.name != "sqlite":
+            return None
+        database = self._sql_engine.url.database
+        return database if database and database != ":memory:" else None
+    
+    def get_pool_status(self) -> str:
+        """Describe the current state of the SQL connection pools."""
+        if not self._sql_engine:
+            return "not initialized"
+        if self._sql_read_engine is self._sql_engine:
+            return self._sql_engine.pool.status()
+        return f"write: {self._sql_engine.pool.status()}; read: {self._sql_read_engine.pool.status()}"
+    
     def is_initialized(self) -> bool:
         """Check if database is properly initialized."""
         return self._initialized
     
     def close_connections(self):
         """Close all database connections."""
+        if self._sql_read_engine and self._sql_read_engine is not self._sql_engine:
+            self._sql_read_engine.dispose()
+        
         if self._sql_engine:
             self._sql_engine.dispose()
             logger.info("SQL database connections closed")
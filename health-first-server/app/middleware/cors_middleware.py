@@ -0,0 +1,29 @@
+from typing import Sequence
+from fastapi.middleware.cors import CORSMiddleware
+
+class AllowListCORSMiddleware(CORSMiddleware):
+    """CORS middleware that checks origins against a precomputed allow-list."""
+
+    def __init__(self, app, allow_origins: Sequence[str] = (), **kwargs):
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allowed_origins = frozenset(origin.lower() for origin in allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        """
+        Check whether a request origin may access the API.
+
+        Args:
+            origin: Value of the request's Origin header
+
+        Returns:
+            True if the origin is in the allow-list, False otherwise
+        """
+        # Scheme and host are case-insensitive, and the allow-list is lowercased
+        if origin.lower() in self.allowed_origins:
+            return True
+        
+        # Wildcard and allow_origin_regex are handled by Starlette as usual
+        if self.allow_all_origins or self.allow_origin_regex is not None:
+            return super().is_allowed_origin(origin)
+        
+        return False
@@ -8,6 +8,10 @@ from dateutil.relativedelta import relativedelta
 from app.config import config
 from app.utils.security import validate_password_strength, sanitize_input
 
+# Compiled once at import; validators run on every registration and update
+_ZIP_CODE_RE = re.compile(r'^[A-Za-z0-9\s\-]{3,20}$')
+_PERSON_NAME_RE = re.compile(r'^[A-Za-z\s\-\'\.]+$')
+
 class Gender(str, Enum):
     MALE = "male"
     FEMALE = "female"
@@ -29,8 +33,7 @@ class AddressSchema(BaseModel):
     @classmethod
     def validate_zip_code(cls, v):
         # Basic postal code validation (supports US ZIP and international formats)
-        zip_pattern = r'^[A-Za-z0-9\s\-]{3,20}$'
-        if not re.match(zip_pattern, v):
+        if not _ZIP_CODE_RE.match(v):
             raise ValueError('Invalid postal/ZIP code format')
         return sanitize_input(v)
 
@@ -43,7 +46,7 @@ class EmergencyContactSchema(BaseModel):
     @classmethod
     def sanitize_text_fields(cls, v):
         sanitized = sanitize_input(v)
-        if not re.match(r'^[A-Za-z\s\-\'\.]+$', sanitized):
+        if not _PERSON_NAME_RE.match(sanitized):
             raise ValueError('Name and relationship can only contain letters, spaces, hyphens, apostrophes, and periods')
         return sanitized
     
@@ -85,7 +88,7 @@ class PatientRegistrationSchema(BaseModel):
     @classmethod
     def validate_names(cls, v):
         sanitized = sanitize_input(v)
-        if not re.match(r'^[A-Za-z\s\-\'\.]+$', sanitized):
+        if not _PERSON_NAME_RE.match(sanitized):
             raise ValueError('Name can only contain letters, spaces, hyphens, apostrophes, and periods')
         return sanitized
     
@@ -216,7 +219,7 @@ class PatientUpdateSchema(BaseModel):
     def validate_names(cls, v):
         if v is not None:
             sanitized = sanitize_input(v)
-            if not re.match(r'^[A-Za-z\s\-\'\.]+$', sanitized):
+            if not _PERSON_NAME_RE.match(sanitized):
                 raise ValueError('Name can only contain letters, spaces, hyphens, apostrophes, and periods')
             return sanitized
         return v
@@ -2,11 +2,42 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 import re
+import functools
 from pydantic import BaseModel, Field, EmailStr, field_validator, model_validator
 import phonenumbers
 from app.config import config
 from app.utils.security import validate_password_strength, sanitize_input
 
+# Compiled once at import; validators run on every registration
+_ZIP_CODE_RE = re.compile(r'^[A-Za-z0-9\s\-]{3,20}$')
+_PERSON_NAME_RE = re.compile(r'^[A-Za-z\s\-\'\.]+$')
+_SPECIALIZATION_RE = re.compile(r'^[A-Za-z\s\-&,\.]+$')
+_LICENSE_NUMBER_RE = re.compile(r'^[A-Za-z0-9]+$')
+
+# Lowercased predefined specialization -> its canonical spelling (first listed wins)
+_PREDEFINED_SPECIALIZATIONS_BY_LOWER = {
+    spec.lower(): spec for spec in reversed(config.PREDEFINED_SPECIALIZATIONS)
+}
+
+@functools.lru_cache(maxsize=1024)
+def _format_e164(phone_number: str) -> Optional[str]:
+    """
+    Parse a phone number and format it as E.164, memoized per input string.
+    
+    Args:
+        phone_number: Phone number in international format
+        
+    Returns:
+        The E.164 number, or None if it parses but is not a valid number
+        
+    Raises:
+        phonenumbers.NumberParseException: If the input cannot be parsed (not cached)
+    """
+    parsed_number = phonenumbers.parse(phone_number, None)
+    if not phonenumbers.is_valid_number(parsed_number):
+        return None
+    return phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164)
+
 class VerificationStatus(str, Enum):
     PENDING = "pending"
     VERIFIED = "verified"
@@ -27,8 +58,7 @@ class ClinicAddressSchema(BaseModel):
     @classmethod
     def validate_zip_code(cls, v):
         # Basic postal code validation (supports US ZIP and international formats)
-        zip_pattern = r'^[A-Za-z0-9\s\-]{3,20}$'
-        if not re.match(zip_pattern, v):
+        if not _ZIP_CODE_RE.match(v):
             raise ValueError('Invalid postal/ZIP code format')
         return sanitize_input(v)
 
@@ -48,7 +78,7 @@ class ProviderRegistrationSchema(BaseModel):
     @classmethod
     def validate_names(cls, v):
         sanitized = sanitize_input(v)
-        if not re.match(r'^[A-Za-z\s\-\'\.]+$', sanitized):
+        if not _PERSON_NAME_RE.match(sanitized):
             raise ValueError('Name can only contain letters, spaces, hyphens, apostrophes, and periods')
         return sanitized
     
@@ -56,12 +86,11 @@ class ProviderRegistrationSchema(BaseModel):
     @classmethod
     def validate_phone_number(cls, v):
         try:
-            # Parse and validate international phone number
-            parsed_number = phonenumbers.parse(v, None)
-            if not phonenumbers.is_valid_number(parsed_number):
+            # Parse and validate international phone number, returned in E.164 format
+            formatted_number = _format_e164(v)
+            if formatted_number is None:
                 raise ValueError('Invalid phone number format')
-            # Return in E.164 format
-            return phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164)
+            return formatted_number
         except phonenumbers.NumberParseException:
             raise ValueError('Invalid phone number format. Please use international format (e.g., +1234567890)')
     
@@ -78,16 +107,14 @@ class ProviderRegistrationSchema(BaseModel):
     def validate_specialization(cls, v):
         sanitized = sanitize_input(v)
         
-        # Check if it's in predefined list (case-insensitive)
-        predefined_lower = [spec.lower() for spec in config.PREDEFINED_SPECIALIZATIONS]
-        if sanitized.lower() in predefined_lower:
-            # Return the properly capitalized version
-            for spec in config.PREDEFINED_SPECIALIZATIONS:
-                if spec.lower() == sanitized.lower():
-                    return spec
+        # Check if it's in predefined list (case-insensitive) and return the
+        # properly capitalized version
+        predefined = _PREDEFINED_SPECIALIZATIONS_BY_LOWER.get(sanitized.lower())
+        if predefined is not None:
+            return predefined
         
         # If not in predefined list, validate format
-        if not re.match(r'^[A-Za-z\s\-&,\.]+$', sanitized):
+        if not _SPECIALIZATION_RE.match(sanitized):
             raise ValueError('Specialization can only contain letters, spaces, hyphens, commas, periods, and ampersands')
         
         return sanitized
@@ -96,7 +123,7 @@ class ProviderRegistrationSchema(BaseModel):
     @classmethod
     def validate_license_number(cls, v):
         sanitized = sanitize_input(v)
-        if not re.match(r'^[A-Za-z0-9]+$', sanitized):
+        if not _LICENSE_NUMBER_RE.match(sanitized):
             raise ValueError('License number must be alphanumeric only')
         return sanitized.upper()  # Store in uppercase for consistency
     
@@ -98,6 +98,26 @@ class AuthService:
                 "error_code": "AUTHENTICATION_ERROR"
             }
     
+    async def get_provider_status(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the account status fields that gate provider login.
+        
+        Args:
+            email: Provider email address
+            
+        Returns:
+            Dict with email, verification_status and is_active, or None if not found
+        """
+        provider = await self.repository.get_provider_by_email(email)
+        if not provider:
+            return None
+        
+        return {
+            "email": provider.get("email"),
+            "verification_status": provider.get("verification_status", "pending"),
+            "is_active": provider.get("is_active", False)
+        }
+    
     def _prepare_provider_data(self, provider: Dict[str, Any]) -> Dict[str, Any]:
         """
         Prepare provider data for response (remove sensitive information).
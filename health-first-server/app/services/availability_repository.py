@@ -6,7 +6,7 @@ from pymongo.errors import DuplicateKeyError, PyMongoError
 import logging
 
 from app.config import config, DatabaseType
-from app.database.connections import db_manager
+from app.database.connections import db_manager, retry_on_disconnect
 from app.models.sql_models import ProviderAvailability, AppointmentSlot, Patient
 from app.models.nosql_models import ProviderAvailabilityDocument, AppointmentSlotDocument, PatientDocument
 
@@ -108,10 +108,11 @@ class SQLAvailabilityRepository(AvailabilityRepositoryInterface):
             logger.error(f"Database error creating availability: {str(e)}")
             raise
     
+    @retry_on_disconnect
     async def get_availability_by_id(self, availability_id: str) -> Optional[Dict[str, Any]]:
         """Get availability by ID."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 availability = session.query(ProviderAvailability).filter(
                     ProviderAvailability.id == availability_id
                 ).first()
@@ -147,10 +148,11 @@ class SQLAvailabilityRepository(AvailabilityRepositoryInterface):
             logger.error(f"Database error getting availability: {str(e)}")
             return None
     
+    @retry_on_disconnect
     async def get_provider_availability(self, provider_id: str, start_date: date = None, end_date: date = None) -> List[Dict[str, Any]]:
         """Get availability for a provider within date range."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 query = session.query(ProviderAvailability).filter(
                     ProviderAvailability.provider_id == provider_id
                 )
@@ -271,10 +273,11 @@ class SQLAvailabilityRepository(AvailabilityRepositoryInterface):
             logger.error(f"Database error creating appointment slot: {str(e)}")
             raise
     
+    @retry_on_disconnect
     async def get_appointment_slots(self, availability_id: str) -> List[Dict[str, Any]]:
         """Get all slots for an availability."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 slots = session.query(AppointmentSlot).filter(
                     AppointmentSlot.availability_id == availability_id
                 ).order_by(AppointmentSlot.slot_start_time).all()
@@ -304,10 +307,11 @@ class SQLAvailabilityRepository(AvailabilityRepositoryInterface):
             logger.error(f"Database error getting appointment slots: {str(e)}")
             return []
     
+    @retry_on_disconnect
     async def get_available_slots(self, provider_id: str, start_date: date = None, end_date: date = None) -> List[Dict[str, Any]]:
         """Get available slots for a provider within date range."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 query = session.query(AppointmentSlot).filter(
                     AppointmentSlot.provider_id == provider_id,
                     AppointmentSlot.status == 'available'
@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from pymongo.errors import DuplicateKeyError, PyMongoError
 import logging
 
 from app.config import config, DatabaseType
-from app.database.connections import db_manager
+from app.database.connections import db_manager, retry_on_disconnect
 from app.models.sql_models import Patient
 from app.models.nosql_models import PatientDocument
 
@@ -38,10 +38,38 @@ class PatientRepositoryInterface(ABC):
     async def update_patient(self, patient_id: str, update_data: Dict[str, Any]) -> bool:
         """Update patient information."""
         pass
+    
+    @abstractmethod
+    async def upsert_patient(self, patient_data: Dict[str, Any]) -> Optional[Union[int, str]]:
+        """Create a patient unless the email is already registered."""
+        pass
 
 class SQLPatientRepository(PatientRepositoryInterface):
     """SQL implementation of patient repository."""
     
+    @staticmethod
+    def _to_columns(patient_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map patient data onto Patient column values for a new record."""
+        return {
+            "first_name": patient_data["first_name"],
+            "last_name": patient_data["last_name"],
+            "email": patient_data["email"],
+            "phone_number": patient_data["phone_number"],
+            "password_hash": patient_data["password_hash"],
+            "date_of_birth": patient_data["date_of_birth"],
+            "gender": patient_data["gender"],
+            "address_street": patient_data["address"]["street"],
+            "address_city": patient_data["address"]["city"],
+            "address_state": patient_data["address"]["state"],
+            "address_zip": patient_data["address"]["zip"],
+            "emergency_contact": patient_data.get("emergency_contact"),
+            "medical_history": patient_data.get("medical_history"),
+            "insurance_info": patient_data.get("insurance_info"),
+            "email_verified": False,
+            "phone_verified": False,
+            "is_active": True
+        }
+    
     async def create_patient(self, patient_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new patient in SQL database.
@@ -59,25 +87,7 @@ class SQLPatientRepository(PatientRepositoryInterface):
         try:
             with db_manager.get_sql_session() as session:
                 # Create patient instance
-                patient = Patient(
-                    first_name=patient_data["first_name"],
-                    last_name=patient_data["last_name"],
-                    email=patient_data["email"],
-                    phone_number=patient_data["phone_number"],
-                    password_hash=patient_data["password_hash"],
-                    date_of_birth=patient_data["date_of_birth"],
-                    gender=patient_data["gender"],
-                    address_street=patient_data["address"]["street"],
-                    address_city=patient_data["address"]["city"],
-                    address_state=patient_data["address"]["state"],
-                    address_zip=patient_data["address"]["zip"],
-                    emergency_contact=patient_data.get("emergency_contact"),
-                    medical_history=patient_data.get("medical_history"),
-                    insurance_info=patient_data.get("insurance_info"),
-                    email_verified=False,
-                    phone_verified=False,
-                    is_active=True
-                )
+                patient = Patient(**self._to_columns(patient_data))
                 
                 session.add(patient)
                 session.flush()  # Get the ID without committing
@@ -100,30 +110,33 @@ class SQLPatientRepository(PatientRepositoryInterface):
             logger.error(f"Database error creating patient: {str(e)}")
             raise RuntimeError("Failed to create patient due to database error")
     
+    @retry_on_disconnect
     async def get_patient_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get patient by email from SQL database."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 patient = session.query(Patient).filter(Patient.email == email).first()
                 return patient.to_dict() if patient else None
         except SQLAlchemyError as e:
             logger.error(f"Database error getting patient by email: {str(e)}")
             return None
     
+    @retry_on_disconnect
     async def get_patient_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """Get patient by phone number from SQL database."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 patient = session.query(Patient).filter(Patient.phone_number == phone_number).first()
                 return patient.to_dict() if patient else None
         except SQLAlchemyError as e:
             logger.error(f"Database error getting patient by phone: {str(e)}")
             return None
     
+    @retry_on_disconnect
     async def get_patient_by_id(self, patient_id: str) -> Optional[Dict[str, Any]]:
         """Get patient by ID from SQL database."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 patient = session.query(Patient).filter(Patient.id == patient_id).first()
                 return patient.to_dict() if patient else None
         except SQLAlchemyError as e:
@@ -157,6 +170,59 @@ class SQLPatientRepository(PatientRepositoryInterface):
             logger.error(f"Database error updating patient: {str(e)}")
             return False
 
+    async def upsert_patient(self, patient_data: Dict[str, Any]) -> Optional[int]:
+        """
+        Create a patient in SQL database in a single statement, skipping existing emails.
+        
+        Args:
+            patient_data: Patient information dictionary
+            
+        Returns:
+            ID of the created patient, or None if the email is already registered
+            
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        try:
+            with db_manager.get_sql_session() as session:
+                dialect = session.get_bind().dialect.name
+                if dialect == "postgresql":
+                    from sqlalchemy.dialects.postgresql import insert
+                elif dialect == "sqlite":
+                    from sqlalchemy.dialects.sqlite import insert
+                else:
+                    from sqlalchemy.dialects.mysql import insert
+                
+                stmt = insert(Patient).values(**self._to_columns(patient_data))
+                if dialect == "mysql":
+                    # MySQL has no ON CONFLICT ... RETURNING. Setting id to itself makes a
+                    # duplicate key a no-op without ignoring every other error like INSERT
+                    # IGNORE; an updated row reports no insert id.
+                    result = session.execute(stmt.on_duplicate_key_update(id=Patient.id))
+                    patient_id = result.lastrowid or None
+                    
+                    # ON DUPLICATE KEY fires on any unique key; unless the email itself
+                    # exists, another key (the phone number) collided, which the other
+                    # dialects' ON CONFLICT (email) reports as an error
+                    if patient_id is None and session.query(Patient.id).filter(
+                        Patient.email == patient_data["email"]
+                    ).first() is None:
+                        logger.error("Database error upserting patient: duplicate key other than email")
+                        raise RuntimeError("Failed to create patient due to database error")
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=["email"]).returning(Patient.id)
+                    patient_id = session.execute(stmt).scalar()
+                
+                session.commit()
+                
+                if patient_id is not None:
+                    logger.info(f"Patient created successfully with ID: {patient_id}")
+                return patient_id
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Database error upserting patient: {str(e)}")
+            raise RuntimeError("Failed to create patient due to database error")
+
 class MongoPatientRepository(PatientRepositoryInterface):
     """MongoDB implementation of patient repository."""
     
@@ -271,6 +337,55 @@ class MongoPatientRepository(PatientRepositoryInterface):
             logger.error(f"Database error updating patient: {str(e)}")
             return False
 
+    async def upsert_patient(self, patient_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Create a patient in MongoDB in a single operation, skipping existing emails.
+        
+        Args:
+            patient_data: Patient information dictionary
+            
+        Returns:
+            ID of the created patient, or None if the email is already registered
+            
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        try:
+            collection = db_manager.get_mongo_collection("patients")
+            
+            document = PatientDocument.create_document(
+                first_name=patient_data["first_name"],
+                last_name=patient_data["last_name"],
+                email=patient_data["email"],
+                phone_number=patient_data["phone_number"],
+                password_hash=patient_data["password_hash"],
+                date_of_birth=patient_data["date_of_birth"].isoformat(),
+                gender=patient_data["gender"],
+                address=patient_data["address"],
+                emergency_contact=patient_data.get("emergency_contact"),
+                medical_history=patient_data.get("medical_history"),
+                insurance_info=patient_data.get("insurance_info"),
+                email_verified=False,
+                phone_verified=False,
+                is_active=True
+            )
+            
+            result = collection.update_one(
+                {"email": patient_data["email"]},
+                {"$setOnInsert": document},
+                upsert=True
+            )
+            
+            if result.upserted_id is None:
+                return None
+            
+            logger.info(f"Patient created successfully with ID: {str(result.upserted_id)}")
+            return str(result.upserted_id)
+            
+        except PyMongoError as e:
+            logger.error(f"Database error upserting patient: {str(e)}")
+            raise RuntimeError("Failed to create patient due to database error")
+
 def get_patient_repository() -> PatientRepositoryInterface:
     """
     Factory function to get the appropriate patient repository based on configuration.
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
+from sqlalchemy import or_
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from pymongo.errors import DuplicateKeyError, PyMongoError
 import logging
 
 from app.config import config, DatabaseType
-from app.database.connections import db_manager
+from app.database.connections import db_manager, retry_on_disconnect
 from app.models.sql_models import Provider
 from app.models.nosql_models import ProviderDocument
 from app.schemas.provider import VerificationStatus
@@ -39,6 +40,45 @@ class ProviderRepositoryInterface(ABC):
     async def get_provider_by_id(self, provider_id: int) -> Optional[Dict[str, Any]]:
         """Get provider by ID."""
         pass
+    
+    @abstractmethod
+    async def get_provider_by_unique_fields(
+        self,
+        email: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        license_number: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get the providers holding any of the given email, phone number or license number in one lookup."""
+        pass
+
+def _match_unique_fields(
+    providers: List[Dict[str, Any]],
+    email: Optional[str],
+    phone_number: Optional[str],
+    license_number: Optional[str]
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Map providers returned by a combined uniqueness lookup back to the field each one matched.
+    
+    Args:
+        providers: Providers matching at least one of the fields
+        email: Email that was looked up
+        phone_number: Phone number that was looked up
+        license_number: License number that was looked up
+        
+    Returns:
+        Dictionary keyed by email, phone_number and license_number; each value is
+        the provider already using that value, or None
+    """
+    matches = {"email": None, "phone_number": None, "license_number": None}
+    lookups = {"email": email, "phone_number": phone_number, "license_number": license_number}
+    
+    for provider in providers:
+        for field, value in lookups.items():
+            if value and matches[field] is None and provider.get(field) == value:
+                matches[field] = provider
+    
+    return matches
 
 class SQLProviderRepository(ProviderRepositoryInterface):
     """SQL implementation of provider repository."""
@@ -100,45 +140,77 @@ class SQLProviderRepository(ProviderRepositoryInterface):
             logger.error(f"Database error creating provider: {str(e)}")
             raise RuntimeError("Failed to create provider due to database error")
     
+    @retry_on_disconnect
     async def get_provider_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get provider by email from SQL database."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 provider = session.query(Provider).filter(Provider.email == email).first()
                 return provider.to_auth_dict() if provider else None
         except SQLAlchemyError as e:
             logger.error(f"Database error getting provider by email: {str(e)}")
             return None
     
+    @retry_on_disconnect
     async def get_provider_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """Get provider by phone number from SQL database."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 provider = session.query(Provider).filter(Provider.phone_number == phone_number).first()
                 return provider.to_dict() if provider else None
         except SQLAlchemyError as e:
             logger.error(f"Database error getting provider by phone: {str(e)}")
             return None
     
+    @retry_on_disconnect
     async def get_provider_by_license(self, license_number: str) -> Optional[Dict[str, Any]]:
         """Get provider by license number from SQL database."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 provider = session.query(Provider).filter(Provider.license_number == license_number).first()
                 return provider.to_dict() if provider else None
         except SQLAlchemyError as e:
             logger.error(f"Database error getting provider by license: {str(e)}")
             return None
     
+    @retry_on_disconnect
     async def get_provider_by_id(self, provider_id: int) -> Optional[Dict[str, Any]]:
         """Get provider by ID from SQL database."""
         try:
-            with db_manager.get_sql_session() as session:
+            with db_manager.get_read_session() as session:
                 provider = session.query(Provider).filter(Provider.id == provider_id).first()
                 return provider.to_dict() if provider else None
         except SQLAlchemyError as e:
             logger.error(f"Database error getting provider by ID: {str(e)}")
             return None
+    
+    @retry_on_disconnect
+    async def get_provider_by_unique_fields(
+        self,
+        email: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        license_number: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get the providers holding any of the given unique fields with a single SQL query."""
+        conditions = []
+        if email:
+            conditions.append(Provider.email == email)
+        if phone_number:
+            conditions.append(Provider.phone_number == phone_number)
+        if license_number:
+            conditions.append(Provider.license_number == license_number)
+        
+        if not conditions:
+            return _match_unique_fields([], email, phone_number, license_number)
+        
+        try:
+            with db_manager.get_read_session() as session:
+                providers = [provider.to_dict() for provider in session.query(Provider).filter(or_(*conditions))]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting provider by unique fields: {str(e)}")
+            raise RuntimeError("Failed to check provider uniqueness due to database error")
+        
+        return _match_unique_fields(providers, email, phone_number, license_number)
 
 class MongoProviderRepository(ProviderRepositoryInterface):
     """MongoDB implementation of provider repository."""
@@ -237,6 +309,33 @@ class MongoProviderRepository(ProviderRepositoryInterface):
         except (PyMongoError, Exception) as e:
             logger.error(f"Database error getting provider by ID: {str(e)}")
             return None
+    
+    async def get_provider_by_unique_fields(
+        self,
+        email: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        license_number: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get the providers holding any of the given unique fields with a single $or query."""
+        conditions = []
+        if email:
+            conditions.append({"email": email})
+        if phone_number:
+            conditions.append({"phone_number": phone_number})
+        if license_number:
+            conditions.append({"license_number": license_number})
+        
+        if not conditions:
+            return _match_unique_fields([], email, phone_number, license_number)
+        
+        try:
+            collection = db_manager.get_providers_collection()
+            providers = [ProviderDocument.to_dict(document) for document in collection.find({"$or": conditions})]
+        except PyMongoError as e:
+            logger.error(f"Database error getting provider by unique fields: {str(e)}")
+            raise RuntimeError("Failed to check provider uniqueness due to database error")
+        
+        return _match_unique_fields(providers, email, phone_number, license_number)
 
 def get_provider_repository() -> ProviderRepositoryInterface:
     """
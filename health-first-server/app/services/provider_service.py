@@ -27,9 +27,19 @@ class ProviderService:
             Tuple of (success: bool, response_data: dict)
         """
         try:
+            # Emails are stored lowercased, matching the login lookup, so the
+            # unique email index serves case-insensitive checks directly
+            email = registration_data.email.strip().lower()
+            
+            # Check email, phone and license uniqueness in one lookup
+            existing = await self.repository.get_provider_by_unique_fields(
+                email=email,
+                phone_number=registration_data.phone_number,
+                license_number=registration_data.license_number
+            )
+            
             # Check for duplicate email
-            existing_email = await self.repository.get_provider_by_email(registration_data.email)
-            if existing_email:
+            if existing["email"]:
                 return False, {
                     "success": False,
                     "message": "Email address is already registered",
@@ -37,8 +47,7 @@ class ProviderService:
                 }
             
             # Check for duplicate phone number
-            existing_phone = await self.repository.get_provider_by_phone(registration_data.phone_number)
-            if existing_phone:
+            if existing["phone_number"]:
                 return False, {
                     "success": False,
                     "message": "Phone number is already registered",
@@ -46,8 +55,7 @@ class ProviderService:
                 }
             
             # Check for duplicate license number
-            existing_license = await self.repository.get_provider_by_license(registration_data.license_number)
-            if existing_license:
+            if existing["license_number"]:
                 return False, {
                     "success": False,
                     "message": "License number is already registered",
@@ -61,7 +69,7 @@ class ProviderService:
             provider_data = {
                 "first_name": registration_data.first_name,
                 "last_name": registration_data.last_name,
-                "email": registration_data.email,
+                "email": email,
                 "phone_number": registration_data.phone_number,
                 "password_hash": password_hash,
                 "specialization": registration_data.specialization,
@@ -176,19 +184,22 @@ class ProviderService:
         
         try:
             if email:
-                existing_email = await self.repository.get_provider_by_email(email)
-                if existing_email:
-                    errors["email"] = ["This email address is already registered"]
-            
-            if phone_number:
-                existing_phone = await self.repository.get_provider_by_phone(phone_number)
-                if existing_phone:
-                    errors["phone_number"] = ["This phone number is already registered"]
-            
-            if license_number:
-                existing_license = await self.repository.get_provider_by_license(license_number)
-                if existing_license:
-                    errors["license_number"] = ["This license number is already registered"]
+                email = email.strip().lower()
+            
+            existing = await self.repository.get_provider_by_unique_fields(
+                email=email,
+                phone_number=phone_number,
+                license_number=license_number
+            )
+            
+            if existing["email"]:
+                errors["email"] = ["This email address is already registered"]
+            
+            if existing["phone_number"]:
+                errors["phone_number"] = ["This phone number is already registered"]
+            
+            if existing["license_number"]:
+                errors["license_number"] = ["This license number is already registered"]
             
             return {
                 "is_valid": len(errors) == 0,
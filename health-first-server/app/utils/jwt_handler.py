@@ -1,11 +1,40 @@
 import jwt
+import hashlib
+import orjson
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 from app.config import config
 
 logger = logging.getLogger(__name__)
 
+class ORJSONPyJWT(jwt.PyJWT):
+    """
+    PyJWT codec that (de)serializes claim payloads with orjson instead of the stdlib json module.
+    
+    PyJWT's public API only accepts a json.JSONEncoder subclass on encode and
+    no decoder at all, so this overrides its private payload hooks. PyJWT is
+    pinned in requirements.txt; re-check these signatures before upgrading it.
+    """
+    
+    def _encode_payload(self, payload: Dict[str, Any], headers: Optional[Dict[str, Any]] = None, json_encoder=None) -> bytes:
+        # PyJWT has already converted datetime claims to timestamps; orjson output is compact like PyJWT's
+        return orjson.dumps(payload)
+    
+    def _decode_payload(self, decoded: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+_jwt = ORJSONPyJWT()
+
 class JWTHandler:
     """Handle JWT token generation and validation."""
     
@@ -16,6 +45,13 @@ class JWTHandler:
         self.patient_access_token_expire_minutes = 30  # 30 minutes for patients as requested
         self.refresh_token_expire_days = 7
         
+        # Verified access-token payloads keyed by token digest, so repeated
+        # requests with the same token skip signature verification
+        self.verify_cache_max_size = 10000
+        self.verify_cache_ttl_seconds = 60
+        self._verify_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._verify_cache_lock = threading.Lock()
+        
     def generate_access_token(self, provider_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate JWT access token for provider.
@@ -44,7 +80,7 @@ class JWTHandler:
             }
             
             # Generate token
-            token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+            token = _jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
             
             logger.info(f"Access token generated for provider: {provider_data['email']}")
             
@@ -73,7 +109,7 @@ class JWTHandler:
                 "exp": expire,
                 "iat": datetime.now(timezone.utc),
             }
-            token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+            token = _jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
             logger.info(f"Refresh token generated for provider: {provider_data['email']}")
             return {
                 "refresh_token": token,
@@ -112,7 +148,7 @@ class JWTHandler:
             }
             
             # Generate token
-            token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+            token = _jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
             
             logger.info(f"Access token generated for patient: {patient_data['email']}")
             
@@ -137,9 +173,14 @@ class JWTHandler:
         Returns:
             Decoded token payload or None if invalid
         """
+        cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._get_cached_payload(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Decode and verify token
-            payload = jwt.decode(
+            payload = _jwt.decode(
                 token, 
                 self.secret_key, 
                 algorithms=[self.algorithm],
@@ -165,6 +206,7 @@ class JWTHandler:
                 logger.warning("Token missing required fields")
                 return None
             
+            self._cache_payload(cache_key, payload)
             return payload
             
         except jwt.ExpiredSignatureError:
@@ -177,6 +219,35 @@ class JWTHandler:
             logger.error(f"Error verifying token: {str(e)}")
             return None
     
+    def _get_cached_payload(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached, still-valid payload, or None."""
+        with self._verify_cache_lock:
+            entry = self._verify_cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            expires_at, payload = entry
+            if time.time() >= expires_at:
+                del self._verify_cache[cache_key]
+                return None
+            
+            self._verify_cache.move_to_end(cache_key)
+            return dict(payload)
+    
+    def _cache_payload(self, cache_key: str, payload: Dict[str, Any]) -> None:
+        """Cache a verified payload until the token expires or the cache TTL passes."""
+        expires_at = min(payload["exp"], time.time() + self.verify_cache_ttl_seconds)
+        with self._verify_cache_lock:
+            self._verify_cache[cache_key] = (expires_at, dict(payload))
+            self._verify_cache.move_to_end(cache_key)
+            while len(self._verify_cache) > self.verify_cache_max_size:
+                self._verify_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached access-token payloads."""
+        with self._verify_cache_lock:
+            self._verify_cache.clear()
+    
     def extract_token_from_header(self, authorization_header: str) -> Optional[str]:
         """
         Extract JWT token from Authorization header.
@@ -208,7 +279,7 @@ class JWTHandler:
             Decoded payload or None if invalid format
         """
         try:
-            return jwt.decode(
+            return _jwt.decode(
                 token, 
                 options={"verify_signature": False, "verify_exp": False}
             )
@@ -220,7 +291,7 @@ class JWTHandler:
         Verify and decode JWT refresh token.
         """
         try:
-            payload = jwt.decode(
+            payload = _jwt.decode(
                 token,
                 self.secret_key,
                 algorithms=[self.algorithm],
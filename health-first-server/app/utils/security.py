@@ -1,61 +1,113 @@
 import re
+import string
 import bcrypt
 import logging
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from app.config import config
 
 logger = logging.getLogger(__name__)
 
+# Prefixes of bcrypt hashes stored before the switch to Argon2id
+BCRYPT_HASH_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Character classes validate_password_strength looks for; 0 is any other byte
+_UPPERCASE, _LOWERCASE, _DIGIT, _SPECIAL_CHAR = 1, 2, 3, 4
+_SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+
+def _build_password_class_table() -> bytes:
+    """Build the bytes.translate table mapping each ASCII byte to its character class."""
+    table = bytearray(256)
+    for chars, char_class in (
+        (string.ascii_uppercase, _UPPERCASE),
+        (string.ascii_lowercase, _LOWERCASE),
+        (string.digits, _DIGIT),
+        (_SPECIAL_CHARS, _SPECIAL_CHAR)
+    ):
+        for byte in chars.encode("ascii"):
+            table[byte] = char_class
+    return bytes(table)
+
+_PASSWORD_CLASS_TABLE = _build_password_class_table()
+
+# Password strength and input sanitization patterns, compiled once at import
+_DIGIT_RE = re.compile(r"\d")
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+# Applied one after another, in this order, as removing one match can expose another
+_DANGEROUS_INPUT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"('\s*(OR|AND)\s*')",
+        r"(--)",
+        r"(;)",
+        r"(\bDROP\b)",
+        r"(\bDELETE\b)",
+        r"(\bINSERT\b)",
+        r"(\bUPDATE\b)",
+        r"(\bSELECT\b)",
+        r"(\bUNION\b)"
+    )
+)
+# Matches wherever any pattern above could; inputs it misses skip the sequential passes
+_DANGEROUS_INPUT_HINT_RE = re.compile(
+    r"'|--|;|\b(?:DROP|DELETE|INSERT|UPDATE|SELECT|UNION)\b", re.IGNORECASE
+)
+
+_password_hasher = PasswordHasher(
+    time_cost=config.ARGON2_TIME_COST,
+    memory_cost=config.ARGON2_MEMORY_COST,
+    parallelism=config.ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16
+)
+
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt directly.
-    TEMPORARY: Password encryption disabled for testing.
+    Hash a password using Argon2id.
     
     Args:
         password: Plain text password
         
     Returns:
-        Hashed password string (currently returns plain text)
+        Encoded hash string including its Argon2 parameters
     """
-    # TEMPORARY FIX: Disable password encryption for testing
-    logger.warning("Password encryption is disabled for testing purposes")
-    return password
-    
-    # Original code (commented out):
-    # try:
-    #     # Use bcrypt directly to avoid compatibility issues
-    #     salt = bcrypt.gensalt(rounds=12)
-    #     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    #     return hashed.decode('utf-8')
-    # except Exception as e:
-    #     logger.error(f"Password hashing failed: {e}")
-    #     raise
+    try:
+        return _password_hasher.hash(password)
+    except Exception as e:
+        logger.error(f"Password hashing failed: {e}")
+        raise
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a password against its hash using bcrypt directly.
-    TEMPORARY: Password encryption disabled for testing.
+    Verify a password against its hash.
+    
+    Argon2id hashes are verified with argon2-cffi; bcrypt hashes created
+    before the switch are still accepted.
     
     Args:
         plain_password: Plain text password
-        hashed_password: Previously hashed password (currently plain text)
+        hashed_password: Previously hashed password
         
     Returns:
         True if password matches, False otherwise
     """
-    # TEMPORARY FIX: Disable password encryption for testing
-    logger.warning("Password verification using plain text comparison for testing")
-    return plain_password == hashed_password
-    
-    # Original code (commented out):
-    # try:
-    #     # Use bcrypt directly to avoid compatibility issues
-    #     return bcrypt.checkpw(
-    #         plain_password.encode('utf-8'), 
-    #         hashed_password.encode('utf-8')
-    #     )
-    # except Exception as e:
-    #     logger.error(f"Password verification failed: {e}")
-    #     return False
+    if hashed_password.startswith(BCRYPT_HASH_PREFIXES):
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode('utf-8'), 
+                hashed_password.encode('utf-8')
+            )
+        except Exception as e:
+            logger.error(f"Password verification failed: {e}")
+            return False
+    
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except VerificationError:
+        return False
+    except InvalidHashError as e:
+        logger.error(f"Password verification failed: {e}")
+        return False
 
 def validate_password_strength(password: str) -> tuple[bool, list[str]]:
     """
@@ -75,16 +127,20 @@ def validate_password_strength(password: str) -> tuple[bool, list[str]]:
     if len(password) > config.MAX_PASSWORD_LENGTH:
         errors.append(f"Password must be no more than {config.MAX_PASSWORD_LENGTH} characters long")
     
-    if not re.search(r"[A-Z]", password):
+    # Classify every character in one pass; only \d matches non-ASCII
+    # characters, so the digit regex runs only when no ASCII digit was seen
+    char_classes = set(password.encode("ascii", "ignore").translate(_PASSWORD_CLASS_TABLE))
+    
+    if _UPPERCASE not in char_classes:
         errors.append("Password must contain at least one uppercase letter")
     
-    if not re.search(r"[a-z]", password):
+    if _LOWERCASE not in char_classes:
         errors.append("Password must contain at least one lowercase letter")
     
-    if not re.search(r"\d", password):
+    if _DIGIT not in char_classes and not _DIGIT_RE.search(password):
         errors.append("Password must contain at least one digit")
     
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+    if _SPECIAL_CHAR not in char_classes:
         errors.append("Password must contain at least one special character")
     
     return len(errors) == 0, errors
@@ -103,22 +159,12 @@ def sanitize_input(input_string: str) -> str:
         return ""
     
     # Remove potential HTML/script tags
-    input_string = re.sub(r'<[^>]*>', '', input_string)
-    
-    # Remove potential SQL injection patterns
-    dangerous_patterns = [
-        r"('\s*(OR|AND)\s*')",
-        r"(--)",
-        r"(;)",
-        r"(\bDROP\b)",
-        r"(\bDELETE\b)",
-        r"(\bINSERT\b)",
-        r"(\bUPDATE\b)",
-        r"(\bSELECT\b)",
-        r"(\bUNION\b)"
-    ]
+    input_string = _HTML_TAG_RE.sub('', input_string)
     
-    for pattern in dangerous_patterns:
-        input_string = re.sub(pattern, '', input_string, flags=re.IGNORECASE)
+    # Remove potential SQL injection patterns; one combined scan rules out
+    # clean input before running each pattern in turn
+    if _DANGEROUS_INPUT_HINT_RE.search(input_string):
+        for pattern in _DANGEROUS_INPUT_RES:
+            input_string = pattern.sub('', input_string)
     
     return input_string.strip() 
\ No newline at end of file
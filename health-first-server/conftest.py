@@ -0,0 +1,93 @@
+import os
+import pytest
+from typing import Generator
+
+# Tests check hashing control flow, not its work factor: run Argon2 at its
+# minimum cost unless the environment asks for something else. Environment
+# defaults here must be set before app.config is imported.
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "8")
+
+from sqlalchemy import insert
+
+from app.config import config, DatabaseType
+from app.database.connections import db_manager
+from app.models.sql_models import Provider
+from app.schemas.provider import VerificationStatus
+from app.services.auth_service import AuthService
+from app.utils.security import hash_password
+
+# One-off scripts that only print diagnostics about one real account (and, for
+# the patient demo, need a running server); run them directly with python instead
+collect_ignore = ["test_rishi_login.py", "test_rishi_login_fixed.py", "test_patient_login_demo.py"]
+
+# Verified providers the login scripts sign in as: (first, last, email, phone, password, license)
+SEED_PROVIDERS = (
+    ("Test", "Provider", "testprovider@example.com", "+15550000001", "TestPass123!", "TEST000001"),
+    ("Demo", "Provider", "demo@healthfirst.com", "+15550000002", "Demo123!", "DEMO000002"),
+)
+
+@pytest.fixture(scope="session", autouse=True)
+def sqlite_test_database(tmp_path_factory) -> None:
+    """
+    Point the SQLite database at a file in pytest's temp directory.
+    
+    Serial runs never touch the app's ./healthfirst.db, and each pytest-xdist
+    worker gets its own temp directory, so parallel writers never contend for
+    the same database lock. The file (with its -wal and -shm files) never
+    lands in the working tree.
+    """
+    database_path = tmp_path_factory.mktemp("db") / "healthfirst.db"
+    config.SQLITE_URL = f"sqlite:///{database_path}"
+
+@pytest.fixture(scope="session")
+def seed_db(sqlite_test_database) -> Generator[None, None, None]:
+    """
+    Create the temp SQLite database once and insert the login-script providers in one transaction.
+    
+    The engines are built directly on SQLITE_URL rather than through the
+    config-driven initialize(), which would connect to any reachable MySQL or
+    PostgreSQL server and seed accounts with known passwords into it.
+    """
+    # Also creates the tables
+    db_manager._configure_sql_engines(config.SQLITE_URL)
+    db_manager._initialized = True
+    
+    if config.DATABASE_TYPE != DatabaseType.MONGODB:
+        with db_manager.get_sql_session() as session:
+            existing = {
+                email for (email,) in session.query(Provider.email).filter(
+                    Provider.email.in_([row[2] for row in SEED_PROVIDERS])
+                )
+            }
+            rows = [
+                {
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "email": email,
+                    "phone_number": phone_number,
+                    "password_hash": hash_password(password),
+                    "specialization": "Cardiology",
+                    "license_number": license_number,
+                    "years_of_experience": 5,
+                    "clinic_street": "123 Medical Center Dr",
+                    "clinic_city": "New York",
+                    "clinic_state": "NY",
+                    "clinic_zip": "10001",
+                    "verification_status": VerificationStatus.VERIFIED,
+                    "is_active": True
+                }
+                for first_name, last_name, email, phone_number, password, license_number in SEED_PROVIDERS
+                if email not in existing
+            ]
+            if rows:
+                # Single executemany; the session commits once on exit
+                session.execute(insert(Provider), rows)
+    
+    yield
+    db_manager.close_connections()
+
+@pytest.fixture(scope="session")
+def auth_service(seed_db) -> AuthService:
+    """Share one AuthService across the login scripts."""
+    return AuthService()
@@ -7,6 +7,7 @@ sys.path.append('.')
 from app.database.connections import db_manager
 from app.services.provider_repository import get_provider_repository
 import sqlite3
+from contextlib import closing
 
 async def debug_provider_data():
     """Debug what data the repository returns vs database."""
@@ -22,12 +23,12 @@ async def debug_provider_data():
     
     # Check raw database data
     print("📊 Raw database data:")
-    conn = sqlite3.connect('healthfirst.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM providers WHERE email = ?', (email,))
-    columns = [description[0] for description in cursor.description]
-    result = cursor.fetchone()
+    # closing() guarantees the handle is released on the early return too;
+    # sqlite3's own context manager only ends the transaction
+    with closing(sqlite3.connect('healthfirst.db')) as conn:
+        cursor = conn.execute('SELECT * FROM providers WHERE email = ?', (email,))
+        columns = [description[0] for description in cursor.description]
+        result = cursor.fetchone()
     
     if result:
         for i, value in enumerate(result):
@@ -36,7 +37,6 @@ async def debug_provider_data():
         print("  ❌ Provider not found")
         return
     
-    conn.close()
     print()
     
     # Check repository data
@@ -1,12 +1,17 @@
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 
 from app.config import config
 from app.database.connections import db_manager
+from app.middleware.cors_middleware import AllowListCORSMiddleware
 from app.api.provider_endpoints import router as provider_router
 from app.api.auth_endpoints import router as auth_router
 from app.api.protected_endpoints import router as protected_router
@@ -59,13 +64,14 @@ app = FastAPI(
     version=config.VERSION,
     docs_url="/docs",  # Always enable for development
     redoc_url="/redoc",  # Always enable for development
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware - Allow all origins for development
+# Add CORS middleware - only the configured origins may make credentialed requests
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
+    AllowListCORSMiddleware,
+    allow_origins=config.ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
@@ -79,92 +85,143 @@ app.include_router(availability_router)
 app.include_router(patient_router)
 app.include_router(patient_auth_router)
 
+# Static part of the root payload, built once at import
+_ROOT_STATIC = {
+    "message": f"Welcome to {config.APP_NAME}",
+    "version": config.VERSION,
+    "status": "healthy",
+    "database_type": config.DATABASE_TYPE,
+    "features": [
+        "Provider Registration",
+        "Patient Registration",
+        "JWT Authentication", 
+        "Multi-Database Support",
+        "Comprehensive Validation",
+        "Security Middleware",
+        "HIPAA Compliance"
+    ],
+    "endpoints": {
+        "provider_registration": "/api/v1/provider/register",
+        "patient_registration": "/api/v1/patient/register",
+        "login": "/api/v1/provider/login",
+        "protected_demo": "/api/v1/provider/profile",
+        "docs": "/docs"
+    }
+}
+
 # Root endpoint
 @app.get("/", tags=["Health Check"])
 async def root():
     """
     Health check endpoint.
     """
-    return JSONResponse(
-        status_code=200,
-        content={
-            "message": f"Welcome to {config.APP_NAME}",
-            "version": config.VERSION,
-            "status": "healthy",
-            "database_type": config.DATABASE_TYPE,
-            "database_connected": db_manager.is_initialized(),
-            "features": [
-                "Provider Registration",
-                "Patient Registration",
-                "JWT Authentication", 
-                "Multi-Database Support",
-                "Comprehensive Validation",
-                "Security Middleware",
-                "HIPAA Compliance"
-            ],
-            "endpoints": {
-                "provider_registration": "/api/v1/provider/register",
-                "patient_registration": "/api/v1/patient/register",
-                "login": "/api/v1/provider/login",
-                "protected_demo": "/api/v1/provider/profile",
-                "docs": "/docs"
-            }
+    return {**_ROOT_STATIC, "database_connected": db_manager.is_initialized()}
+
+async def _check_sql() -> Dict[str, str]:
+    """Probe the SQL database."""
+    sqlite_path = db_manager.get_sqlite_path()
+    if sqlite_path:
+        # A local SQLite connection cannot drop independently of its file, so a
+        # SELECT 1 round trip proves nothing beyond the file being present
+        if not os.path.exists(sqlite_path):
+            raise RuntimeError(f"SQLite database file not found: {sqlite_path}")
+        return {
+            "database_status": "connected",
+            "database_pool": db_manager.get_pool_status()
         }
-    )
+    
+    def probe():
+        with db_manager.get_read_session() as session:
+            session.execute(text("SELECT 1"))
+    
+    await asyncio.to_thread(probe)
+    return {"database_status": "connected"}
+
+async def _check_mongo() -> Dict[str, str]:
+    """Probe the MongoDB providers collection."""
+    def probe():
+        collection = db_manager.get_providers_collection()
+        collection.find_one()
+    
+    await asyncio.to_thread(probe)
+    return {"database_status": "connected"}
+
+def _get_health_checks() -> Dict[str, Callable[[], Awaitable[Dict[str, str]]]]:
+    """Return the subsystem probes that apply to the current configuration."""
+    if config.DATABASE_TYPE == "mongodb":
+        return {"database_status": _check_mongo}
+    return {"database_status": _check_sql}
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+async def _build_health_status() -> Dict[str, Any]:
+    """Run the subsystem probes and assemble a fresh health report."""
+    health_status = {
+        "status": "healthy",
+        "version": config.VERSION,
+        "database_type": config.DATABASE_TYPE,
+        "database_connected": db_manager.is_initialized(),
+        "timestamp": _utc_timestamp()
+    }
+    
+    # Test subsystem connectivity if initialized
+    if db_manager.is_initialized():
+        checks = _get_health_checks()
+        results = await asyncio.gather(
+            *(check() for check in checks.values()),
+            return_exceptions=True
+        )
+        
+        for name, result in zip(checks, results):
+            if isinstance(result, BaseException):
+                health_status[name] = f"error: {str(result)}"
+                health_status["status"] = "degraded"
+            else:
+                health_status.update(result)
+    else:
+        health_status["database_status"] = "not initialized"
+        health_status["status"] = "degraded"
+    
+    return health_status
+
+# Last health report and the monotonic time at which it goes stale
+_health_cache: Dict[str, Any] = {"expires_at": 0.0, "report": None}
 
 # Health check endpoint
 @app.get("/health", tags=["Health Check"])
 async def health_check():
     """
     Detailed health check endpoint.
+    
+    All subsystem probes run concurrently, so total latency is bounded by
+    the slowest probe rather than the sum of all of them. The report,
+    including its timestamp, is reused for HEALTH_CHECK_CACHE_TTL seconds.
     """
     try:
-        # Basic health check
-        health_status = {
-            "status": "healthy",
-            "version": config.VERSION,
-            "database_type": config.DATABASE_TYPE,
-            "database_connected": db_manager.is_initialized(),
-            "timestamp": "2024-01-01T00:00:00Z"  # In real app, use actual timestamp
-        }
-        
-        # Test database connectivity if initialized
-        if db_manager.is_initialized():
-            if config.DATABASE_TYPE == "mongodb":
-                try:
-                    collection = db_manager.get_providers_collection()
-                    collection.find_one()
-                    health_status["database_status"] = "connected"
-                except Exception as e:
-                    health_status["database_status"] = f"error: {str(e)}"
-                    health_status["status"] = "degraded"
-            else:
-                try:
-                    with db_manager.get_sql_session() as session:
-                        session.execute(text("SELECT 1"))
-                    health_status["database_status"] = "connected"
-                except Exception as e:
-                    health_status["database_status"] = f"error: {str(e)}"
-                    health_status["status"] = "degraded"
-        else:
-            health_status["database_status"] = "not initialized"
-            health_status["status"] = "degraded"
+        now = time.monotonic()
+        health_status = _health_cache["report"]
+        if health_status is None or now >= _health_cache["expires_at"]:
+            health_status = await _build_health_status()
+            _health_cache["report"] = health_status
+            _health_cache["expires_at"] = now + config.HEALTH_CHECK_CACHE_TTL
         
         status_code = 200 if health_status["status"] == "healthy" else 503
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content=health_status
         )
     
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": "2024-01-01T00:00:00Z"
+                "timestamp": _utc_timestamp()
             }
         )
 
@@ -177,5 +234,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=config.DEBUG,
+        loop="uvloop" if not config.DEBUG else "asyncio",
+        http="httptools",
+        workers=1 if config.DEBUG else os.cpu_count(),
         log_level="info" if not config.DEBUG else "debug"
     ) 
\ No newline at end of file
@@ -6,110 +6,158 @@ sys.path.append('.')
 
 import sqlite3
 import os
-from app.database.connections import db_manager
+from contextlib import closing
+from sqlalchemy import insert
+from app.database.connections import db_manager, apply_sqlite_pragmas
 from app.models.sql_models import Provider
 from app.schemas.provider import VerificationStatus
 
+DATABASE_PATH = 'healthfirst.db'
+BACKUP_PATH = 'healthfirst.db.bak'
+# WAL journaling keeps committed rows in these files until a checkpoint
+SQLITE_SIDECAR_SUFFIXES = ('-wal', '-shm')
+BATCH_SIZE = 1000
+
+def _remove_database_files(path):
+    """Delete a SQLite database file together with its -wal and -shm files."""
+    for file_path in (path, *(path + suffix for suffix in SQLITE_SIDECAR_SUFFIXES)):
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+def _backup_database(source_path, backup_path):
+    """
+    Copy a SQLite database, including rows still in its WAL, to backup_path.
+    
+    The WAL is checkpointed into the main file first, and the copy goes through
+    sqlite3's online backup API so it is a consistent snapshot. The source
+    files are left in place; the caller removes them once the copy exists.
+    """
+    with closing(sqlite3.connect(source_path)) as source:
+        source.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        with closing(sqlite3.connect(backup_path)) as backup:
+            source.backup(backup)
+
+def _has_providers_table(conn):
+    """Return whether the backup database has a providers table to migrate."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'providers'"
+    ).fetchone()
+    return row is not None
+
+def _iter_provider_batches(cursor, batch_size=BATCH_SIZE):
+    """Yield provider rows from the backup database in fixed-size batches."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        
+        batch = []
+        for row in rows:
+            # Convert verification status string to enum
+            verification_status = VerificationStatus.VERIFIED if row[12] == 'VERIFIED' else VerificationStatus.PENDING
+            
+            batch.append({
+                'first_name': row[0],
+                'last_name': row[1],
+                'email': row[2],
+                'phone_number': row[3],
+                'password_hash': row[4],
+                'specialization': row[5],
+                'license_number': row[6],
+                'years_of_experience': row[7],
+                'clinic_street': row[8],
+                'clinic_city': row[9],
+                'clinic_state': row[10],
+                'clinic_zip': row[11],
+                'verification_status': verification_status,
+                'is_active': bool(row[13])
+            })
+        yield batch
+
 async def migrate_to_integer_ids():
     """Migrate from UUID IDs to integer IDs while preserving data."""
     
     print("🔄 Migrating database from UUID IDs to integer IDs...")
     
-    # Backup current data
+    # Back up current data by copying the old database (and its WAL) aside;
+    # rows are streamed from the backup into the new database so they never
+    # sit in memory at once
     print("📦 Backing up existing provider data...")
     
-    # Read existing provider data
-    existing_providers = []
-    if os.path.exists('healthfirst.db'):
-        conn = sqlite3.connect('healthfirst.db')
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                SELECT first_name, last_name, email, phone_number, password_hash, 
-                       specialization, license_number, years_of_experience,
-                       clinic_street, clinic_city, clinic_state, clinic_zip,
-                       verification_status, is_active
-                FROM providers
-            ''')
-            
-            for row in cursor.fetchall():
-                existing_providers.append({
-                    'first_name': row[0],
-                    'last_name': row[1],
-                    'email': row[2],
-                    'phone_number': row[3],
-                    'password_hash': row[4],
-                    'specialization': row[5],
-                    'license_number': row[6],
-                    'years_of_experience': row[7],
-                    'clinic_street': row[8],
-                    'clinic_city': row[9],
-                    'clinic_state': row[10],
-                    'clinic_zip': row[11],
-                    'verification_status': row[12],
-                    'is_active': bool(row[13])
-                })
-                
-            print(f"✅ Found {len(existing_providers)} providers to migrate")
-            
-        except Exception as e:
-            print(f"ℹ️  No existing providers table or data: {e}")
-        
-        conn.close()
+    if os.path.exists(BACKUP_PATH):
+        # Left by an earlier failed run and possibly the only copy of the old data
+        raise RuntimeError(
+            f"{BACKUP_PATH} already exists; restore or remove it before migrating again"
+        )
     
-    # Remove old database
-    if os.path.exists('healthfirst.db'):
-        os.remove('healthfirst.db')
-        print("🗑️  Removed old database")
+    has_backup = os.path.exists(DATABASE_PATH)
+    if has_backup:
+        _backup_database(DATABASE_PATH, BACKUP_PATH)
+        _remove_database_files(DATABASE_PATH)
+        print(f"🗑️  Moved old database to {BACKUP_PATH}")
     
     # Initialize new database with integer IDs
     print("🏗️  Creating new database with integer IDs...")
     db_manager.initialize()
     
     # Recreate providers with new schema
-    if existing_providers:
-        print("📝 Migrating provider data...")
-        
-        with db_manager.get_sql_session() as session:
-            for i, provider_data in enumerate(existing_providers, 1):
-                # Convert verification status string to enum
-                verification_status = VerificationStatus.VERIFIED if provider_data['verification_status'] == 'VERIFIED' else VerificationStatus.PENDING
-                
-                provider = Provider(
-                    first_name=provider_data['first_name'],
-                    last_name=provider_data['last_name'],
-                    email=provider_data['email'],
-                    phone_number=provider_data['phone_number'],
-                    password_hash=provider_data['password_hash'],
-                    specialization=provider_data['specialization'],
-                    license_number=provider_data['license_number'],
-                    years_of_experience=provider_data['years_of_experience'],
-                    clinic_street=provider_data['clinic_street'],
-                    clinic_city=provider_data['clinic_city'],
-                    clinic_state=provider_data['clinic_state'],
-                    clinic_zip=provider_data['clinic_zip'],
-                    verification_status=verification_status,
-                    is_active=provider_data['is_active']
-                )
-                
-                session.add(provider)
-                session.flush()  # Get the auto-generated ID
+    migrated_count = 0
+    first_email = last_email = None
+    if has_backup:
+        try:
+            with closing(sqlite3.connect(BACKUP_PATH)) as conn:
+                apply_sqlite_pragmas(conn)
                 
-                print(f"✅ Migrated provider: {provider_data['email']} -> ID: {provider.id}")
-            
-            session.commit()
+                if not _has_providers_table(conn):
+                    print("ℹ️  No existing providers table to migrate")
+                else:
+                    cursor = conn.execute('''
+                        SELECT first_name, last_name, email, phone_number, password_hash, 
+                               specialization, license_number, years_of_experience,
+                               clinic_street, clinic_city, clinic_state, clinic_zip,
+                               verification_status, is_active
+                        FROM providers
+                    ''')
+                    
+                    print("📝 Migrating provider data...")
+                    
+                    # One batched INSERT and commit per chunk keeps memory and journal size bounded
+                    for batch in _iter_provider_batches(cursor):
+                        with db_manager.get_sql_session() as session:
+                            session.execute(insert(Provider), batch)
+                            session.commit()
+                        migrated_count += len(batch)
+                        first_email = first_email or batch[0]["email"]
+                        last_email = batch[-1]["email"]
+                    
+                    if migrated_count:
+                        print(f"✅ Migrated {migrated_count} providers: first={first_email}, last={last_email}")
+                    else:
+                        print("✅ Migrated 0 providers")
+        except Exception:
+            # Keep the only full copy of the old data; migrated batches stay in the new database
+            print(f"❌ Migration failed after {migrated_count} providers; old data kept in {BACKUP_PATH}")
+            raise
+        
+        # The backup is only deleted once every row made it across
+        _remove_database_files(BACKUP_PATH)
     
     # Verify migration
     print("\n🔍 Verifying migration...")
-    with db_manager.get_sql_session() as session:
-        providers = session.query(Provider).all()
+    with db_manager.get_read_session() as session:
+        provider_count = session.query(Provider).count()
+        first_provider = session.query(Provider).order_by(Provider.id).first()
+        last_provider = session.query(Provider).order_by(Provider.id.desc()).first()
         
-        print("📊 Migrated providers:")
-        for provider in providers:
-            print(f"  ID: {provider.id} | {provider.first_name} {provider.last_name} | {provider.email}")
+        if first_provider:
+            print(
+                f"📊 {provider_count} providers in new database: "
+                f"IDs {first_provider.id} ({first_provider.email}) to {last_provider.id} ({last_provider.email})"
+            )
+        else:
+            print("📊 0 providers in new database")
     
-    print(f"\n🎉 Migration complete! {len(existing_providers)} providers migrated to integer IDs.")
+    print(f"\n🎉 Migration complete! {migrated_count} providers migrated to integer IDs.")
     print("🔗 API endpoints now use simple integer IDs:")
     print("   GET /api/v1/provider/1")
     print("   POST /api/v1/provider/1/availability")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import asyncio
+import sys
+sys.path.append('.')
+
+from sqlalchemy import func, update
+from app.config import config, DatabaseType
+from app.database.connections import db_manager
+from app.models.sql_models import Provider
+
+def _normalize_sql_emails():
+    """
+    Lowercase every stored provider email in the SQL database in one UPDATE.
+    
+    Returns:
+        Number of rows changed
+    
+    Raises:
+        RuntimeError: If two providers' emails differ only by case
+    """
+    with db_manager.get_sql_session() as session:
+        conflicts = [
+            email for (email,) in session.query(func.lower(Provider.email))
+            .group_by(func.lower(Provider.email))
+            .having(func.count() > 1)
+        ]
+        if conflicts:
+            raise RuntimeError(f"Emails registered more than once with different case: {', '.join(conflicts)}")
+        
+        result = session.execute(
+            update(Provider)
+            .where(Provider.email != func.lower(Provider.email))
+            .values(email=func.lower(Provider.email))
+        )
+        return result.rowcount
+
+def _normalize_mongo_emails():
+    """
+    Lowercase every stored provider email in MongoDB in one updateMany.
+    
+    Returns:
+        Number of documents changed
+    
+    Raises:
+        RuntimeError: If two providers' emails differ only by case
+    """
+    collection = db_manager.get_providers_collection()
+    
+    conflicts = [
+        group["_id"] for group in collection.aggregate([
+            {"$group": {"_id": {"$toLower": "$email"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}}
+        ])
+    ]
+    if conflicts:
+        raise RuntimeError(f"Emails registered more than once with different case: {', '.join(conflicts)}")
+    
+    # One-off scan; every lookup afterwards is an exact match on the email index
+    result = collection.update_many(
+        {"$expr": {"$ne": ["$email", {"$toLower": "$email"}]}},
+        [{"$set": {"email": {"$toLower": "$email"}}}]
+    )
+    return result.modified_count
+
+async def normalize_provider_emails():
+    """Lowercase stored provider emails so lookups can compare them exactly."""
+    
+    print("🔄 Normalizing stored provider emails to lowercase...")
+    
+    db_manager.initialize()
+    if not db_manager.is_initialized():
+        raise RuntimeError("Database could not be initialized")
+    
+    try:
+        if config.DATABASE_TYPE == DatabaseType.MONGODB:
+            changed = _normalize_mongo_emails()
+        else:
+            changed = _normalize_sql_emails()
+    finally:
+        db_manager.close_connections()
+    
+    print(f"✅ Lowercased {changed} provider emails")
+
+if __name__ == "__main__":
+    asyncio.run(normalize_provider_emails())
@@ -6,9 +6,8 @@ This script demonstrates the complete patient login flow.
 
 import asyncio
 import json
-import requests
+import httpx
 from datetime import date
-from app.utils.security import hash_password
 from app.services.patient_repository import get_patient_repository
 from app.config import config
 
@@ -30,6 +29,12 @@ DEMO_PATIENT = {
     }
 }
 
+# Argon2id hash of DEMO_PATIENT["password"], precomputed so runs skip hashing. The
+# hash carries its own salt and parameters, so verify_password accepts it as is.
+# Regenerate with
+#   python -c "from app.utils.security import hash_password; print(hash_password('DemoPatient123!'))"
+DEMO_PATIENT_HASH = "$argon2id$v=19$m=47104,t=2,p=1$hNQmr8wKk3EmVmez/fX85A$MlDm/WiygNcg5Hga2Ees4oOJljPHJigRvNuayiXZ3/Q"
+
 async def create_demo_patient():
     """Create a demo patient for testing login."""
     try:
@@ -37,37 +42,31 @@ async def create_demo_patient():
         
         repository = get_patient_repository()
         
-        # Check if patient already exists
-        existing_patient = await repository.get_patient_by_email(DEMO_PATIENT["email"])
-        if existing_patient:
-            print(f"✅ Demo patient already exists: {DEMO_PATIENT['email']}")
-            return True
-        
-        # Hash password
-        password_hash = hash_password(DEMO_PATIENT["password"])
-        
         # Prepare patient data
         patient_data = {
             "first_name": DEMO_PATIENT["first_name"],
             "last_name": DEMO_PATIENT["last_name"],
             "email": DEMO_PATIENT["email"],
             "phone_number": DEMO_PATIENT["phone_number"],
-            "password_hash": password_hash,
+            "password_hash": DEMO_PATIENT_HASH,
             "date_of_birth": DEMO_PATIENT["date_of_birth"],
             "gender": DEMO_PATIENT["gender"],
             "address": DEMO_PATIENT["address"]
         }
         
-        # Create patient
-        created_patient = await repository.create_patient(patient_data)
-        print(f"✅ Demo patient created successfully: {created_patient['patient_id']}")
+        # Create patient unless it already exists (single statement)
+        patient_id = await repository.upsert_patient(patient_data)
+        if patient_id is None:
+            print(f"✅ Demo patient already exists: {DEMO_PATIENT['email']}")
+        else:
+            print(f"✅ Demo patient created successfully: {patient_id}")
         return True
         
     except Exception as e:
         print(f"❌ Error creating demo patient: {str(e)}")
         return False
 
-def test_patient_login():
+async def test_patient_login(client: httpx.AsyncClient):
     """Test patient login endpoint."""
     try:
         print("\n🔐 Testing Patient Login...")
@@ -77,8 +76,8 @@ def test_patient_login():
             "password": DEMO_PATIENT["password"]
         }
         
-        response = requests.post(
-            f"{BASE_URL}/api/v1/patient/login",
+        response = await client.post(
+            "/api/v1/patient/login",
             json=login_data,
             headers={"Content-Type": "application/json"}
         )
@@ -102,147 +101,162 @@ def test_patient_login():
             print(f"❌ Login failed: {response.text}")
             return None
             
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ Cannot connect to server. Make sure the server is running on localhost:8000")
         return None
     except Exception as e:
         print(f"❌ Error during login: {str(e)}")
         return None
 
-def test_token_validation(token):
-    """Test token validation endpoint."""
+async def test_token_validation(client: httpx.AsyncClient, token):
+    """Test token validation endpoint; returns the lines to print."""
+    lines = []
     try:
-        print("\n🔍 Testing Token Validation...")
+        lines.append("\n🔍 Testing Token Validation...")
         
-        response = requests.post(
-            f"{BASE_URL}/api/v1/patient/validate-token",
+        response = await client.post(
+            "/api/v1/patient/validate-token",
             json={"token": token},
             headers={"Content-Type": "application/json"}
         )
         
-        print(f"Status Code: {response.status_code}")
+        lines.append(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
             data = response.json()
             if data.get('success') and data.get('data', {}).get('valid'):
-                print("✅ Token is valid!")
-                print(f"👤 Patient ID: {data['data']['patient_id']}")
-                print(f"📧 Email: {data['data']['email']}")
-                print(f"🏃 Active: {data['data']['is_active']}")
+                lines.append("✅ Token is valid!")
+                lines.append(f"👤 Patient ID: {data['data']['patient_id']}")
+                lines.append(f"📧 Email: {data['data']['email']}")
+                lines.append(f"🏃 Active: {data['data']['is_active']}")
             else:
-                print(f"❌ Token validation failed: {data.get('data', {}).get('error', 'Unknown error')}")
+                lines.append(f"❌ Token validation failed: {data.get('data', {}).get('error', 'Unknown error')}")
         else:
-            print(f"❌ Token validation request failed: {response.text}")
+            lines.append(f"❌ Token validation request failed: {response.text}")
             
     except Exception as e:
-        print(f"❌ Error during token validation: {str(e)}")
+        lines.append(f"❌ Error during token validation: {str(e)}")
+    
+    return lines
 
-def test_patient_profile(token):
-    """Test getting patient profile with token."""
+async def test_patient_profile(client: httpx.AsyncClient, token):
+    """Test getting patient profile with token; returns the lines to print."""
+    lines = []
     try:
-        print("\n👤 Testing Patient Profile Access...")
+        lines.append("\n👤 Testing Patient Profile Access...")
         
         headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
         
-        response = requests.get(
-            f"{BASE_URL}/api/v1/patient/profile",
+        response = await client.get(
+            "/api/v1/patient/profile",
             headers=headers
         )
         
-        print(f"Status Code: {response.status_code}")
+        lines.append(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
             data = response.json()
-            print("✅ Profile retrieved successfully!")
+            lines.append("✅ Profile retrieved successfully!")
             patient = data['data']
-            print(f"👤 Name: {patient['first_name']} {patient['last_name']}")
-            print(f"📧 Email: {patient['email']}")
-            print(f"📱 Phone: {patient['phone_number']}")
-            print(f"🎂 Date of Birth: {patient['date_of_birth']}")
-            print(f"🏠 Address: {patient['address']['street']}, {patient['address']['city']}, {patient['address']['state']}")
+            lines.append(f"👤 Name: {patient['first_name']} {patient['last_name']}")
+            lines.append(f"📧 Email: {patient['email']}")
+            lines.append(f"📱 Phone: {patient['phone_number']}")
+            lines.append(f"🎂 Date of Birth: {patient['date_of_birth']}")
+            lines.append(f"🏠 Address: {patient['address']['street']}, {patient['address']['city']}, {patient['address']['state']}")
         else:
-            print(f"❌ Profile access failed: {response.text}")
+            lines.append(f"❌ Profile access failed: {response.text}")
             
     except Exception as e:
-        print(f"❌ Error during profile access: {str(e)}")
+        lines.append(f"❌ Error during profile access: {str(e)}")
+    
+    return lines
 
-def test_verification_status(token):
-    """Test getting patient verification status."""
+async def test_verification_status(client: httpx.AsyncClient, token):
+    """Test getting patient verification status; returns the lines to print."""
+    lines = []
     try:
-        print("\n✅ Testing Verification Status...")
+        lines.append("\n✅ Testing Verification Status...")
         
         headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
         
-        response = requests.get(
-            f"{BASE_URL}/api/v1/patient/verification-status",
+        response = await client.get(
+            "/api/v1/patient/verification-status",
             headers=headers
         )
         
-        print(f"Status Code: {response.status_code}")
+        lines.append(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
             data = response.json()
-            print("✅ Verification status retrieved!")
+            lines.append("✅ Verification status retrieved!")
             status_data = data['data']
-            print(f"✉️  Email Verified: {status_data['email_verified']}")
-            print(f"📱 Phone Verified: {status_data['phone_verified']}")
+            lines.append(f"✉️  Email Verified: {status_data['email_verified']}")
+            lines.append(f"📱 Phone Verified: {status_data['phone_verified']}")
         else:
-            print(f"❌ Verification status request failed: {response.text}")
+            lines.append(f"❌ Verification status request failed: {response.text}")
             
     except Exception as e:
-        print(f"❌ Error during verification status check: {str(e)}")
+        lines.append(f"❌ Error during verification status check: {str(e)}")
+    
+    return lines
 
-def test_invalid_login():
-    """Test login with invalid credentials."""
+async def test_invalid_login(client: httpx.AsyncClient):
+    """Test login with invalid credentials; returns the lines to print."""
+    lines = []
     try:
-        print("\n🚫 Testing Invalid Login...")
+        lines.append("\n🚫 Testing Invalid Login...")
         
         invalid_data = {
             "email": DEMO_PATIENT["email"],
             "password": "wrongpassword"
         }
         
-        response = requests.post(
-            f"{BASE_URL}/api/v1/patient/login",
+        response = await client.post(
+            "/api/v1/patient/login",
             json=invalid_data,
             headers={"Content-Type": "application/json"}
         )
         
-        print(f"Status Code: {response.status_code}")
+        lines.append(f"Status Code: {response.status_code}")
         
         if response.status_code == 401:
             data = response.json()
-            print("✅ Invalid login correctly rejected!")
-            print(f"❌ Error: {data['message']}")
-            print(f"🏷️  Error Code: {data['error_code']}")
+            lines.append("✅ Invalid login correctly rejected!")
+            lines.append(f"❌ Error: {data['message']}")
+            lines.append(f"🏷️  Error Code: {data['error_code']}")
         else:
-            print(f"⚠️  Unexpected response: {response.text}")
+            lines.append(f"⚠️  Unexpected response: {response.text}")
             
     except Exception as e:
-        print(f"❌ Error during invalid login test: {str(e)}")
+        lines.append(f"❌ Error during invalid login test: {str(e)}")
+    
+    return lines
 
-def test_unauthorized_access():
-    """Test accessing protected endpoint without token."""
+async def test_unauthorized_access(client: httpx.AsyncClient):
+    """Test accessing protected endpoint without token; returns the lines to print."""
+    lines = []
     try:
-        print("\n🔒 Testing Unauthorized Access...")
+        lines.append("\n🔒 Testing Unauthorized Access...")
         
-        response = requests.get(f"{BASE_URL}/api/v1/patient/profile")
+        response = await client.get("/api/v1/patient/profile")
         
-        print(f"Status Code: {response.status_code}")
+        lines.append(f"Status Code: {response.status_code}")
         
         if response.status_code == 401:
-            print("✅ Unauthorized access correctly blocked!")
+            lines.append("✅ Unauthorized access correctly blocked!")
         else:
-            print(f"⚠️  Unexpected response: {response.text}")
+            lines.append(f"⚠️  Unexpected response: {response.text}")
             
     except Exception as e:
-        print(f"❌ Error during unauthorized access test: {str(e)}")
+        lines.append(f"❌ Error during unauthorized access test: {str(e)}")
+    
+    return lines
 
 async def main():
     """Run the complete patient login demo."""
@@ -255,26 +269,25 @@ async def main():
         print("❌ Failed to create demo patient. Exiting.")
         return
     
-    # Test successful login
-    token = test_patient_login()
-    if not token:
-        print("❌ Login failed. Cannot proceed with other tests.")
-        return
-    
-    # Test token validation
-    test_token_validation(token)
-    
-    # Test profile access
-    test_patient_profile(token)
-    
-    # Test verification status
-    test_verification_status(token)
-    
-    # Test invalid login
-    test_invalid_login()
-    
-    # Test unauthorized access
-    test_unauthorized_access()
+    # One shared client keeps a single keep-alive connection for every call
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        # Test successful login
+        token = await test_patient_login(client)
+        if not token:
+            print("❌ Login failed. Cannot proceed with other tests.")
+            return
+        
+        # The remaining checks are independent of each other, so run them concurrently;
+        # each returns its output, printed in order afterwards so it never interleaves
+        results = await asyncio.gather(
+            test_token_validation(client, token),
+            test_patient_profile(client, token),
+            test_verification_status(client, token),
+            test_invalid_login(client),
+            test_unauthorized_access(client)
+        )
+        for lines in results:
+            print("\n".join(lines))
     
     print("\n🎉 Patient Login Demo Completed!")
     print("=" * 50)
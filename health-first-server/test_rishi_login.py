@@ -4,11 +4,14 @@ import asyncio
 import sys
 sys.path.append('.')
 
-import sqlite3
-import bcrypt
-from app.utils.security import verify_password
+import pytest
+from app.models.sql_models import Provider
+from app.services.auth_service import AuthService
+from app.schemas.auth import ProviderLoginSchema
+from app.database.connections import db_manager
 
-async def test_rishi_login():
+@pytest.mark.asyncio
+async def test_rishi_login(auth_service: AuthService):
     """Test Rishi's login credentials and password verification."""
     
     email = "rishi.vyas1110@gmail.com"
@@ -19,48 +22,24 @@ async def test_rishi_login():
     print(f"Password: {password}")
     print()
     
-    # Connect to database and get provider data
-    conn = sqlite3.connect('healthfirst.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT email, password_hash, verification_status, is_active 
-        FROM providers 
-        WHERE email = ?
-    ''', (email,))
-    
-    result = cursor.fetchone()
-    
-    if not result:
-        print("❌ Provider not found in database")
-        return
-    
-    db_email, password_hash, verification_status, is_active = result
-    
-    print("📋 Provider details from database:")
-    print(f"Email: {db_email}")
-    print(f"Password hash: {password_hash[:50]}...")
-    print(f"Verification status: {verification_status}")
-    print(f"Is active: {is_active}")
-    print()
-    
-    # Test password verification
-    print("🔐 Testing password verification...")
-    password_match = verify_password(password, password_hash)
-    print(f"Password verification: {'✅ PASS' if password_match else '❌ FAIL'}")
-    
-    # Test with bcrypt directly
-    bcrypt_match = bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
-    print(f"Direct bcrypt check: {'✅ PASS' if bcrypt_match else '❌ FAIL'}")
-    print()
+    # Fetch the stored provider fields for diagnostics
+    with db_manager.get_read_session() as session:
+        provider = session.query(Provider).filter_by(email=email).first()
+        
+        if not provider:
+            print("❌ Provider not found in database")
+            return
+        
+        print("📋 Provider details from database:")
+        print(f"Email: {provider.email}")
+        print(f"Password hash: {provider.password_hash[:50]}...")
+        print(f"Verification status: {provider.verification_status}")
+        print(f"Is active: {provider.is_active}")
+        print()
     
     # Test the full auth service
     print("🔍 Testing with AuthService...")
-    from app.services.auth_service import AuthService
-    from app.schemas.auth import ProviderLoginSchema
-    
     login_data = ProviderLoginSchema(email=email, password=password)
-    auth_service = AuthService()
     
     success, response_data = await auth_service.authenticate_provider(login_data)
     
@@ -76,8 +55,7 @@ async def test_rishi_login():
         if response_data.get('error_code') == 'ACCOUNT_NOT_VERIFIED':
             print("\n💡 SOLUTION: The account needs to be verified!")
             print("The password is correct but verification_status is PENDING instead of VERIFIED")
-    
-    conn.close()
 
 if __name__ == "__main__":
-    asyncio.run(test_rishi_login()) 
\ No newline at end of file
+    db_manager.initialize()
+    asyncio.run(test_rishi_login(AuthService())) 
\ No newline at end of file
@@ -4,10 +4,11 @@ import asyncio
 import sys
 sys.path.append('.')
 
+import uvloop
+
 from app.database.connections import db_manager
 from app.services.auth_service import AuthService
 from app.schemas.auth import ProviderLoginSchema
-import sqlite3
 
 async def test_rishi_login_fixed():
     """Test Rishi's login with proper database initialization."""
@@ -26,39 +27,25 @@ async def test_rishi_login_fixed():
     print("✅ Database initialized")
     print()
     
-    # Check current database state
-    conn = sqlite3.connect('healthfirst.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT email, password_hash, verification_status, is_active 
-        FROM providers 
-        WHERE email = ?
-    ''', (email,))
+    auth_service = AuthService()
     
-    result = cursor.fetchone()
-    
-    if result:
-        db_email, password_hash, verification_status, is_active = result
-        print("📋 Current provider status:")
-        print(f"Email: {db_email}")
-        print(f"Password hash: {password_hash[:50]}...")
-        print(f"Verification status: {verification_status}")
-        print(f"Is active: {is_active}")
-        print()
-    else:
+    # Check current account status through the service's pooled connections
+    status = await auth_service.get_provider_status(email)
+    if not status:
         print("❌ Provider not found in database")
-        conn.close()
         return
     
-    conn.close()
+    print("📋 Current provider status:")
+    print(f"Email: {status['email']}")
+    print(f"Verification status: {status['verification_status']}")
+    print(f"Is active: {status['is_active']}")
+    print()
     
     # Test the full auth service with proper initialization
     print("🔍 Testing with AuthService (with proper database)...")
     
     try:
         login_data = ProviderLoginSchema(email=email, password=password)
-        auth_service = AuthService()
         
         success, response_data = await auth_service.authenticate_provider(login_data)
         
@@ -80,4 +67,5 @@ async def test_rishi_login_fixed():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    uvloop.install()
     asyncio.run(test_rishi_login_fixed()) 
\ No newline at end of file
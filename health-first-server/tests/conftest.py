@@ -1,24 +1,103 @@
 import pytest
-import asyncio
-from typing import Generator, AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock
-from fastapi.testclient import TestClient
+import pytest_asyncio
+import httpx
+import orjson
+import uvloop
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Awaitable, Callable, Generator, Mapping
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from main import app
+from app.api.auth_endpoints import get_auth_service
+from app.database.connections import DatabaseManager
+from app.middleware.auth_middleware import get_current_provider, get_optional_current_provider
+from app.schemas.provider import ProviderRegistrationSchema
+from app.services.auth_service import AuthService
 from app.services.provider_service import ProviderService
 from app.services.provider_repository import ProviderRepositoryInterface
+from app.utils.security import hash_password
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> uvloop.EventLoopPolicy:
+    """Run the session event loop on uvloop."""
+    return uvloop.EventLoopPolicy()
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create an async client that calls the FastAPI app in-process, without a portal thread."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+@pytest.fixture(scope="session")
+def openapi_spec() -> Mapping[str, Any]:
+    """The app's OpenAPI schema, built once per session (FastAPI memoizes it on the app)."""
+    return MappingProxyType(app.openapi())
+
+@pytest.fixture(scope="session")
+def areturn() -> Callable[[Any], Callable[..., Awaitable[Any]]]:
+    """Build plain coroutine functions that return a fixed value, for stubbing repository lookups."""
+    def build(value: Any) -> Callable[..., Awaitable[Any]]:
+        async def _f(*args, **kwargs):
+            return value
+        return _f
+    return build
+
+@pytest.fixture
+def sqlite_db_manager(tmp_path) -> Generator[DatabaseManager, None, None]:
+    """Database manager backed by an empty SQLite file in tmp_path, for repository tests."""
+    manager = DatabaseManager()
+    manager._configure_sql_engines(f"sqlite:///{tmp_path / 'repository.db'}")
+    yield manager
+    manager.close_connections()
+
+@pytest.fixture(scope="class")
+def mock_provider_service() -> Generator[MagicMock, None, None]:
+    """Patch the provider endpoints' service once per test class."""
+    patcher = patch('app.api.provider_endpoints.provider_service')
+    mock_service = patcher.start()
+    yield mock_service
+    patcher.stop()
 
 @pytest.fixture
-def client() -> TestClient:
-    """Create a test client for FastAPI app."""
-    return TestClient(app)
+def fake_auth_service() -> Generator[AsyncMock, None, None]:
+    """Serve the auth endpoints a mock AuthService through a dependency override."""
+    fake_service = AsyncMock(spec=AuthService)
+    app.dependency_overrides[get_auth_service] = lambda: fake_service
+    yield fake_service
+    app.dependency_overrides.pop(get_auth_service, None)
+
+@pytest.fixture
+def authenticated_provider() -> Generator[Mapping[str, Any], None, None]:
+    """Serve the auth endpoints a fixed provider as the caller through dependency overrides."""
+    provider = MappingProxyType({
+        "provider_id": "test-id",
+        "email": "test@example.com",
+        "first_name": "John",
+        "last_name": "Doe",
+        "verification_status": "verified",
+        "is_active": True
+    })
+    app.dependency_overrides[get_current_provider] = lambda: dict(provider)
+    app.dependency_overrides[get_optional_current_provider] = lambda: dict(provider)
+    yield provider
+    app.dependency_overrides.pop(get_current_provider, None)
+    app.dependency_overrides.pop(get_optional_current_provider, None)
+
+@pytest.fixture(scope="module")
+def auth_service() -> AuthService:
+    """
+    Share one AuthService per test module.
+    
+    Overrides the root auth_service fixture, which initializes and seeds the
+    database for the login scripts; unit tests patch the repository instead.
+    """
+    return AuthService()
+
+@pytest.fixture(scope="session")
+def hashed_secure_password() -> str:
+    """Hash of "SecurePassword123!", computed once per session."""
+    return hash_password("SecurePassword123!")
 
 @pytest.fixture
 def mock_provider_repository() -> AsyncMock:
@@ -33,14 +112,14 @@ def provider_service_with_mock_repo(mock_provider_repository) -> ProviderService
     service.repository = mock_provider_repository
     return service
 
-@pytest.fixture
-def valid_provider_data() -> dict:
-    """Valid provider registration data for testing."""
-    return {
+@pytest.fixture(scope="session")
+def valid_provider_data() -> Mapping[str, Any]:
+    """Valid provider registration data for testing (read-only; copy with dict() to modify)."""
+    return MappingProxyType({
         "first_name": "John",
         "last_name": "Doe",
         "email": "john.doe@clinic.com",
-        "phone_number": "+1234567890",
+        "phone_number": "+12125551234",
         "password": "SecurePassword123!",
         "confirm_password": "SecurePassword123!",
         "specialization": "Cardiology",
@@ -52,12 +131,17 @@ def valid_provider_data() -> dict:
             "state": "NY",
             "zip": "10001"
         }
-    }
+    })
 
-@pytest.fixture
-def invalid_provider_data() -> dict:
+@pytest.fixture(scope="session")
+def valid_registration_schema(valid_provider_data) -> ProviderRegistrationSchema:
+    """valid_provider_data validated once per session (treat as read-only; use model_copy() to modify)."""
+    return ProviderRegistrationSchema(**valid_provider_data)
+
+@pytest.fixture(scope="session")
+def invalid_provider_data() -> Mapping[str, Any]:
     """Invalid provider registration data for testing."""
-    return {
+    return MappingProxyType({
         "first_name": "A",  # Too short
         "last_name": "",    # Empty
         "email": "invalid-email",  # Invalid format
@@ -73,12 +157,22 @@ def invalid_provider_data() -> dict:
             "state": "",   # Empty
             "zip": "invalid123456789"  # Too long
         }
-    }
+    })
 
-@pytest.fixture
-def duplicate_provider_data() -> dict:
+@pytest.fixture(scope="session")
+def valid_provider_json(valid_provider_data) -> bytes:
+    """valid_provider_data serialized once as a JSON request body."""
+    return orjson.dumps(dict(valid_provider_data))
+
+@pytest.fixture(scope="session")
+def invalid_provider_json(invalid_provider_data) -> bytes:
+    """invalid_provider_data serialized once as a JSON request body."""
+    return orjson.dumps(dict(invalid_provider_data))
+
+@pytest.fixture(scope="session")
+def duplicate_provider_data() -> Mapping[str, Any]:
     """Provider data that would cause duplicate conflicts."""
-    return {
+    return MappingProxyType({
         "first_name": "Jane",
         "last_name": "Smith",
         "email": "existing@clinic.com",  # Duplicate email
@@ -94,17 +188,17 @@ def duplicate_provider_data() -> dict:
             "state": "MA",
             "zip": "02101"
         }
-    }
+    })
 
-@pytest.fixture
-def mock_created_provider() -> dict:
+@pytest.fixture(scope="session")
+def mock_created_provider() -> Mapping[str, Any]:
     """Mock created provider response."""
-    return {
+    return MappingProxyType({
         "provider_id": "550e8400-e29b-41d4-a716-446655440000",
         "first_name": "John",
         "last_name": "Doe",
         "email": "john.doe@clinic.com",
-        "phone_number": "+1234567890",
+        "phone_number": "+12125551234",
         "specialization": "Cardiology",
         "license_number": "MD123456789",
         "years_of_experience": 10,
@@ -118,4 +212,4 @@ def mock_created_provider() -> dict:
         "is_active": True,
         "created_at": "2024-01-01T00:00:00Z",
         "updated_at": "2024-01-01T00:00:00Z"
-    } 
\ No newline at end of file
+    }) 
\ No newline at end of file
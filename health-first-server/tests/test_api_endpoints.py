@@ -1,36 +1,45 @@
 import pytest
+import asyncio
 import json
-from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+def resolved(result):
+    """Return an already-completed future; it can be awaited any number of times."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(result)
+    return future
 
 class TestProviderRegistrationEndpoint:
     """Test provider registration API endpoint."""
     
-    def test_successful_registration(self, client, valid_provider_data):
+    @pytest.mark.asyncio
+    async def test_successful_registration(self, async_client, mock_provider_service, valid_provider_data, valid_provider_json):
         """Test successful provider registration."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            # Mock successful registration
-            mock_service.register_provider.return_value = (True, {
-                "success": True,
-                "message": "Provider registered successfully. Verification email sent.",
-                "data": {
-                    "provider_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "email": "john.doe@clinic.com",
-                    "verification_status": "pending"
-                }
-            })
-            
-            response = client.post("/api/v1/provider/register", json=valid_provider_data)
-            
-            assert response.status_code == 201
-            data = response.json()
-            assert data["success"] is True
-            assert "provider_id" in data["data"]
-            assert data["data"]["email"] == valid_provider_data["email"]
+        # Mock successful registration
+        mock_provider_service.register_provider.return_value = resolved((True, {
+            "success": True,
+            "message": "Provider registered successfully. Verification email sent.",
+            "data": {
+                "provider_id": "550e8400-e29b-41d4-a716-446655440000",
+                "email": "john.doe@clinic.com",
+                "verification_status": "pending"
+            }
+        }))
+        
+        response = await async_client.post("/api/v1/provider/register", content=valid_provider_json, headers=JSON_HEADERS)
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert data["success"] is True
+        assert "provider_id" in data["data"]
+        assert data["data"]["email"] == valid_provider_data["email"]
     
-    def test_validation_error_response(self, client, invalid_provider_data):
+    @pytest.mark.asyncio
+    async def test_validation_error_response(self, async_client, invalid_provider_json):
         """Test validation error response for invalid data."""
-        response = client.post("/api/v1/provider/register", json=invalid_provider_data)
+        response = await async_client.post("/api/v1/provider/register", content=invalid_provider_json, headers=JSON_HEADERS)
         
         assert response.status_code == 422
         data = response.json()
@@ -38,75 +47,30 @@ class TestProviderRegistrationEndpoint:
         assert "errors" in data
         assert isinstance(data["errors"], dict)
     
-    def test_duplicate_email_conflict(self, client, valid_provider_data):
-        """Test duplicate email conflict response."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            # Mock duplicate email response
-            mock_service.register_provider.return_value = (False, {
-                "success": False,
-                "message": "Email address is already registered",
-                "errors": {"email": ["This email address is already registered"]}
-            })
-            
-            response = client.post("/api/v1/provider/register", json=valid_provider_data)
-            
-            assert response.status_code == 409
-            data = response.json()
-            assert data["success"] is False
-            assert "email" in data["errors"]
-    
-    def test_duplicate_phone_conflict(self, client, valid_provider_data):
-        """Test duplicate phone number conflict response."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            # Mock duplicate phone response
-            mock_service.register_provider.return_value = (False, {
-                "success": False,
-                "message": "Phone number is already registered",
-                "errors": {"phone_number": ["This phone number is already registered"]}
-            })
-            
-            response = client.post("/api/v1/provider/register", json=valid_provider_data)
-            
-            assert response.status_code == 409
-            data = response.json()
-            assert data["success"] is False
-            assert "phone_number" in data["errors"]
-    
-    def test_duplicate_license_conflict(self, client, valid_provider_data):
-        """Test duplicate license number conflict response."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            # Mock duplicate license response
-            mock_service.register_provider.return_value = (False, {
-                "success": False,
-                "message": "License number is already registered",
-                "errors": {"license_number": ["This license number is already registered"]}
-            })
-            
-            response = client.post("/api/v1/provider/register", json=valid_provider_data)
-            
-            assert response.status_code == 409
-            data = response.json()
-            assert data["success"] is False
-            assert "license_number" in data["errors"]
-    
-    def test_server_error_response(self, client, valid_provider_data):
-        """Test server error response."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            # Mock server error response
-            mock_service.register_provider.return_value = (False, {
-                "success": False,
-                "message": "Registration failed due to server error. Please try again later.",
-                "errors": {"server": ["Internal server error"]}
-            })
-            
-            response = client.post("/api/v1/provider/register", json=valid_provider_data)
-            
-            assert response.status_code == 500
-            data = response.json()
-            assert data["success"] is False
-            assert "server" in data["errors"]
+    @pytest.mark.parametrize("field,message,error,status_code", [
+        ("email", "Email address is already registered", "This email address is already registered", 409),
+        ("phone_number", "Phone number is already registered", "This phone number is already registered", 409),
+        ("license_number", "License number is already registered", "This license number is already registered", 409),
+        ("server", "Registration failed due to server error. Please try again later.", "Internal server error", 500),
+    ])
+    @pytest.mark.asyncio
+    async def test_registration_failure_response(self, async_client, mock_provider_service, valid_provider_json, field, message, error, status_code):
+        """Test duplicate-field conflict and server error responses."""
+        mock_provider_service.register_provider.return_value = resolved((False, {
+            "success": False,
+            "message": message,
+            "errors": {field: [error]}
+        }))
+        
+        response = await async_client.post("/api/v1/provider/register", content=valid_provider_json, headers=JSON_HEADERS)
+        
+        assert response.status_code == status_code
+        data = response.json()
+        assert data["success"] is False
+        assert field in data["errors"]
     
-    def test_missing_required_fields(self, client):
+    @pytest.mark.asyncio
+    async def test_missing_required_fields(self, async_client):
         """Test response when required fields are missing."""
         incomplete_data = {
             "first_name": "John",
@@ -114,19 +78,20 @@ class TestProviderRegistrationEndpoint:
             # Missing many required fields
         }
         
-        response = client.post("/api/v1/provider/register", json=incomplete_data)
+        response = await async_client.post("/api/v1/provider/register", json=incomplete_data)
         
         assert response.status_code == 422
         data = response.json()
         assert data["success"] is False
         assert "errors" in data
     
-    def test_invalid_json_format(self, client):
+    @pytest.mark.asyncio
+    async def test_invalid_json_format(self, async_client):
         """Test response for invalid JSON format."""
-        response = client.post(
+        response = await async_client.post(
             "/api/v1/provider/register",
-            data="invalid json",
-            headers={"content-type": "application/json"}
+            content="invalid json",
+            headers=JSON_HEADERS
         )
         
         assert response.status_code == 422
@@ -134,105 +99,75 @@ class TestProviderRegistrationEndpoint:
 class TestUniqueFieldValidationEndpoint:
     """Test unique field validation endpoint."""
     
-    def test_validate_unique_fields_all_valid(self, client):
-        """Test validation endpoint when all fields are unique."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            mock_service.validate_unique_fields.return_value = {
-                "is_valid": True,
-                "errors": {}
-            }
-            
-            response = client.get(
-                "/api/v1/provider/validate",
-                params={
-                    "email": "new@clinic.com",
-                    "phone_number": "+1111111111",
-                    "license_number": "NEW123456"
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["is_valid"] is True
-            assert len(data["errors"]) == 0
-    
-    def test_validate_unique_fields_with_duplicates(self, client):
-        """Test validation endpoint when fields are not unique."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            mock_service.validate_unique_fields.return_value = {
-                "is_valid": False,
-                "errors": {
-                    "email": ["This email address is already registered"]
-                }
-            }
-            
-            response = client.get(
-                "/api/v1/provider/validate",
-                params={"email": "existing@clinic.com"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["is_valid"] is False
-            assert "email" in data["errors"]
-    
-    def test_validate_partial_fields(self, client):
-        """Test validation endpoint with only some fields."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            mock_service.validate_unique_fields.return_value = {
-                "is_valid": True,
-                "errors": {}
-            }
-            
-            response = client.get(
-                "/api/v1/provider/validate",
-                params={"email": "test@clinic.com"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["is_valid"] is True
+    @pytest.mark.parametrize("params,service_result", [
+        # All fields unique
+        (
+            {"email": "new@clinic.com", "phone_number": "+1111111111", "license_number": "NEW123456"},
+            {"is_valid": True, "errors": {}}
+        ),
+        # Duplicate email
+        (
+            {"email": "existing@clinic.com"},
+            {"is_valid": False, "errors": {"email": ["This email address is already registered"]}}
+        ),
+        # Only some fields supplied
+        (
+            {"email": "test@clinic.com"},
+            {"is_valid": True, "errors": {}}
+        ),
+    ])
+    @pytest.mark.asyncio
+    async def test_validate_unique_fields(self, async_client, mock_provider_service, params, service_result):
+        """Test validation endpoint passes the service result through."""
+        mock_provider_service.validate_unique_fields.return_value = resolved(service_result)
+        
+        response = await async_client.get("/api/v1/provider/validate", params=params)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["is_valid"] is service_result["is_valid"]
+        assert data["errors"].keys() == service_result["errors"].keys()
 
 class TestGetProviderEndpoint:
     """Test get provider endpoint."""
     
-    def test_get_existing_provider(self, client):
-        """Test getting an existing provider."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            mock_provider = {
-                "provider_id": "550e8400-e29b-41d4-a716-446655440000",
+    @pytest.mark.parametrize("provider_id,service_result,status_code", [
+        (
+            1,
+            {
+                "provider_id": 1,
                 "first_name": "John",
                 "last_name": "Doe",
                 "email": "john.doe@clinic.com",
                 "verification_status": "pending"
-            }
-            mock_service.get_provider_by_id.return_value = mock_provider
-            
-            response = client.get("/api/v1/provider/550e8400-e29b-41d4-a716-446655440000")
-            
-            assert response.status_code == 200
-            data = response.json()
+            },
+            200
+        ),
+        (999, {}, 404),
+    ])
+    @pytest.mark.asyncio
+    async def test_get_provider(self, async_client, mock_provider_service, provider_id, service_result, status_code):
+        """Test getting an existing and a missing provider."""
+        mock_provider_service.get_provider_by_id.return_value = resolved(service_result)
+        
+        response = await async_client.get(f"/api/v1/provider/info/{provider_id}")
+        
+        assert response.status_code == status_code
+        data = response.json()
+        if service_result:
             assert data["success"] is True
-            assert data["data"]["provider_id"] == "550e8400-e29b-41d4-a716-446655440000"
-    
-    def test_get_nonexistent_provider(self, client):
-        """Test getting a provider that doesn't exist."""
-        with patch('app.api.provider_endpoints.provider_service') as mock_service:
-            mock_service.get_provider_by_id.return_value = {}
-            
-            response = client.get("/api/v1/provider/nonexistent-id")
-            
-            assert response.status_code == 404
-            data = response.json()
+            assert data["data"]["provider_id"] == provider_id
+        else:
             assert data["success"] is False
             assert "not found" in data["message"]
 
 class TestHealthCheckEndpoints:
     """Test health check endpoints."""
     
-    def test_root_endpoint(self, client):
+    @pytest.mark.asyncio
+    async def test_root_endpoint(self, async_client):
         """Test root health check endpoint."""
-        response = client.get("/")
+        response = await async_client.get("/")
         
         assert response.status_code == 200
         data = response.json()
@@ -241,9 +176,10 @@ class TestHealthCheckEndpoints:
         assert "status" in data
         assert data["status"] == "healthy"
     
-    def test_health_endpoint(self, client):
+    @pytest.mark.asyncio
+    async def test_health_endpoint(self, async_client):
         """Test detailed health check endpoint."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         
         # Should return 200 or 503 depending on database status
         assert response.status_code in [200, 503]
@@ -1,26 +1,46 @@
 import pytest
 import json
+import jwt
+import orjson
 from unittest.mock import patch, AsyncMock
 from datetime import datetime, timezone, timedelta
 from app.utils.jwt_handler import jwt_handler
-from app.services.auth_service import AuthService
 from app.schemas.auth import ProviderLoginSchema
-from app.utils.security import hash_password
+
+_PROVIDER_DATA = {
+    "provider_id": "test-provider-id",
+    "email": "test@example.com",
+    "specialization": "Cardiology",
+    "verification_status": "verified",
+    "is_active": True
+}
+
+# Login request bodies, encoded once at import
+JSON_HEADERS = {"content-type": "application/json"}
+_LOGIN_BODY = orjson.dumps({"email": "test@example.com", "password": "SecurePassword123!"})
+_WRONG_PASSWORD_LOGIN_BODY = orjson.dumps({"email": "test@example.com", "password": "wrongpassword"})
+_INVALID_LOGIN_BODY = orjson.dumps({"email": "invalid-email", "password": ""})
+
+# Signed once at import; the verification tests only need a valid and an expired token
+_VALID_TOKEN = jwt_handler.generate_access_token(_PROVIDER_DATA)["access_token"]
+_EXPIRED_TOKEN = jwt.encode(
+    {
+        **_PROVIDER_DATA,
+        "exp": datetime.now(timezone.utc) - timedelta(hours=1),
+        "iat": datetime.now(timezone.utc) - timedelta(hours=2),
+        "type": "access_token",
+        "role": "provider"
+    },
+    jwt_handler.secret_key,
+    algorithm=jwt_handler.algorithm
+)
 
 class TestJWTHandler:
     """Test JWT token generation and validation."""
     
     def test_generate_access_token(self):
         """Test JWT token generation."""
-        provider_data = {
-            "provider_id": "test-provider-id",
-            "email": "test@example.com",
-            "specialization": "Cardiology",
-            "verification_status": "verified",
-            "is_active": True
-        }
-        
-        token_data = jwt_handler.generate_access_token(provider_data)
+        token_data = jwt_handler.generate_access_token(_PROVIDER_DATA)
         
         assert "access_token" in token_data
         assert "expires_in" in token_data
@@ -31,18 +51,7 @@ class TestJWTHandler:
     
     def test_verify_valid_token(self):
         """Test JWT token verification with valid token."""
-        provider_data = {
-            "provider_id": "test-provider-id",
-            "email": "test@example.com",
-            "specialization": "Cardiology",
-            "verification_status": "verified",
-            "is_active": True
-        }
-        
-        token_data = jwt_handler.generate_access_token(provider_data)
-        token = token_data["access_token"]
-        
-        payload = jwt_handler.verify_access_token(token)
+        payload = jwt_handler.verify_access_token(_VALID_TOKEN)
         
         assert payload is not None
         assert payload["provider_id"] == "test-provider-id"
@@ -59,61 +68,58 @@ class TestJWTHandler:
         
         assert payload is None
     
-    def test_verify_expired_token(self):
-        """Test JWT token verification with expired token."""
-        # Create a token that expires immediately
-        original_expire = jwt_handler.access_token_expire_hours
-        jwt_handler.access_token_expire_hours = -1  # Negative hours = expired
+    def test_verify_token_uses_cache(self):
+        """Test repeated verification of the same token skips decoding."""
+        jwt_handler.clear_cache()
+        token = jwt_handler.generate_access_token(_PROVIDER_DATA)["access_token"]
+        first = jwt_handler.verify_access_token(token)
         
-        provider_data = {
-            "provider_id": "test-provider-id",
-            "email": "test@example.com",
-            "specialization": "Cardiology",
-            "verification_status": "verified",
-            "is_active": True
-        }
+        with patch('app.utils.jwt_handler._jwt.decode') as mock_decode:
+            second = jwt_handler.verify_access_token(token)
+            mock_decode.assert_not_called()
         
-        token_data = jwt_handler.generate_access_token(provider_data)
-        token = token_data["access_token"]
+        assert second == first
         
-        # Restore original expire time
-        jwt_handler.access_token_expire_hours = original_expire
+        # Callers get their own copy of the cached payload
+        second["email"] = "changed@example.com"
+        assert jwt_handler.verify_access_token(token)["email"] == "test@example.com"
+    
+    def test_verify_expired_token(self):
+        """Test JWT token verification with expired token."""
+        jwt_handler.clear_cache()
         
-        payload = jwt_handler.verify_access_token(token)
+        payload = jwt_handler.verify_access_token(_EXPIRED_TOKEN)
         
         assert payload is None
     
     def test_extract_token_from_header(self):
         """Test token extraction from Authorization header."""
-        # Valid Bearer token
         valid_header = "Bearer valid.jwt.token"
         token = jwt_handler.extract_token_from_header(valid_header)
         assert token == "valid.jwt.token"
-        
-        # Invalid format
-        invalid_headers = [
-            "InvalidFormat token",
-            "Bearer",
-            "Bearer token1 token2",
-            "",
-            None
-        ]
-        
-        for header in invalid_headers:
-            token = jwt_handler.extract_token_from_header(header)
-            assert token is None
+    
+    @pytest.mark.parametrize("header", [
+        "InvalidFormat token",
+        "Bearer",
+        "Bearer token1 token2",
+        "",
+        None
+    ])
+    def test_extract_token_from_header_invalid(self, header):
+        """Test token extraction rejects malformed Authorization headers."""
+        assert jwt_handler.extract_token_from_header(header) is None
 
 class TestAuthService:
     """Test authentication service functionality."""
     
     @pytest.mark.asyncio
-    async def test_successful_authentication(self):
+    async def test_successful_authentication(self, monkeypatch, areturn, auth_service, hashed_secure_password):
         """Test successful provider authentication."""
         # Mock provider data
         provider_data = {
             "provider_id": "test-id",
             "email": "test@example.com",
-            "password_hash": hash_password("SecurePassword123!"),
+            "password_hash": hashed_secure_password,
             "verification_status": "verified",
             "is_active": True,
             "first_name": "John",
@@ -121,258 +127,182 @@ class TestAuthService:
             "specialization": "Cardiology"
         }
         
-        auth_service = AuthService()
-        
-        with patch.object(auth_service.repository, 'get_provider_by_email', return_value=provider_data):
-            login_data = ProviderLoginSchema(
-                email="test@example.com",
-                password="SecurePassword123!"
-            )
-            
-            success, response = await auth_service.authenticate_provider(login_data)
-            
-            assert success is True
-            assert response["success"] is True
-            assert "access_token" in response["data"]
-            assert response["data"]["token_type"] == "Bearer"
-            assert "provider" in response["data"]
-            
-            # Ensure password_hash is not in response
-            assert "password_hash" not in str(response)
-    
-    @pytest.mark.asyncio
-    async def test_authentication_invalid_email(self):
-        """Test authentication with non-existent email."""
-        auth_service = AuthService()
-        
-        with patch.object(auth_service.repository, 'get_provider_by_email', return_value=None):
-            login_data = ProviderLoginSchema(
-                email="nonexistent@example.com",
-                password="password123"
-            )
-            
-            success, response = await auth_service.authenticate_provider(login_data)
-            
-            assert success is False
-            assert response["error_code"] == "INVALID_CREDENTIALS"
+        monkeypatch.setattr(auth_service.repository, "get_provider_by_email", areturn(provider_data))
+        
+        login_data = ProviderLoginSchema(
+            email="test@example.com",
+            password="SecurePassword123!"
+        )
+        
+        success, response = await auth_service.authenticate_provider(login_data)
+        
+        assert success is True
+        assert response["success"] is True
+        assert "access_token" in response["data"]
+        assert response["data"]["token_type"] == "Bearer"
+        assert "provider" in response["data"]
+        
+        # Ensure password_hash is not in response
+        assert "password_hash" not in str(response)
     
     @pytest.mark.asyncio
-    async def test_authentication_invalid_password(self):
-        """Test authentication with wrong password."""
-        provider_data = {
-            "provider_id": "test-id",
-            "email": "test@example.com",
-            "password_hash": hash_password("CorrectPassword123!"),
-            "verification_status": "verified",
-            "is_active": True
-        }
+    @pytest.mark.parametrize("provider_overrides, password, expected_code", [
+        (None, "SecurePassword123!", "INVALID_CREDENTIALS"),
+        ({}, "WrongPassword123!", "INVALID_CREDENTIALS"),
+        ({"is_active": False}, "SecurePassword123!", "ACCOUNT_DEACTIVATED"),
+        ({"verification_status": "pending"}, "SecurePassword123!", "ACCOUNT_NOT_VERIFIED")
+    ], ids=["unknown_email", "wrong_password", "inactive_account", "unverified_account"])
+    async def test_authentication_rejected(self, monkeypatch, areturn, auth_service, hashed_secure_password,
+                                           provider_overrides, password, expected_code):
+        """Test authentication failures; provider_overrides of None means no provider has the email."""
+        provider_data = None
+        if provider_overrides is not None:
+            provider_data = {
+                "provider_id": "test-id",
+                "email": "test@example.com",
+                "password_hash": hashed_secure_password,
+                "verification_status": "verified",
+                "is_active": True,
+                **provider_overrides
+            }
+        
+        monkeypatch.setattr(auth_service.repository, "get_provider_by_email", areturn(provider_data))
+        
+        login_data = ProviderLoginSchema(email="test@example.com", password=password)
+        success, response = await auth_service.authenticate_provider(login_data)
         
-        auth_service = AuthService()
-        
-        with patch.object(auth_service.repository, 'get_provider_by_email', return_value=provider_data):
-            login_data = ProviderLoginSchema(
-                email="test@example.com",
-                password="WrongPassword123!"
-            )
-            
-            success, response = await auth_service.authenticate_provider(login_data)
-            
-            assert success is False
-            assert response["error_code"] == "INVALID_CREDENTIALS"
+        assert success is False
+        assert response["error_code"] == expected_code
     
     @pytest.mark.asyncio
-    async def test_authentication_inactive_account(self):
-        """Test authentication with inactive account."""
-        provider_data = {
-            "provider_id": "test-id",
-            "email": "test@example.com",
-            "password_hash": hash_password("SecurePassword123!"),
-            "verification_status": "verified",
-            "is_active": False  # Inactive account
-        }
+    async def test_token_validation_valid_token(self, monkeypatch, areturn, auth_service):
+        """Test token validation with valid token."""
+        monkeypatch.setattr(auth_service.repository, "get_provider_by_email", areturn(_PROVIDER_DATA))
         
-        auth_service = AuthService()
-        
-        with patch.object(auth_service.repository, 'get_provider_by_email', return_value=provider_data):
-            login_data = ProviderLoginSchema(
-                email="test@example.com",
-                password="SecurePassword123!"
-            )
-            
-            success, response = await auth_service.authenticate_provider(login_data)
-            
-            assert success is False
-            assert response["error_code"] == "ACCOUNT_DEACTIVATED"
+        result = await auth_service.validate_token(_VALID_TOKEN)
+        
+        assert result["valid"] is True
+        assert result["provider_id"] == "test-provider-id"
+        assert result["email"] == "test@example.com"
     
     @pytest.mark.asyncio
-    async def test_authentication_unverified_account(self):
-        """Test authentication with unverified account."""
-        provider_data = {
-            "provider_id": "test-id",
-            "email": "test@example.com",
-            "password_hash": hash_password("SecurePassword123!"),
-            "verification_status": "pending",  # Unverified account
-            "is_active": True
-        }
+    async def test_token_validation_invalid_token(self, auth_service):
+        """Test token validation with invalid token."""
+        result = await auth_service.validate_token("invalid.token")
         
-        auth_service = AuthService()
-        
-        with patch.object(auth_service.repository, 'get_provider_by_email', return_value=provider_data):
-            login_data = ProviderLoginSchema(
-                email="test@example.com",
-                password="SecurePassword123!"
-            )
-            
-            success, response = await auth_service.authenticate_provider(login_data)
-            
-            assert success is False
-            assert response["error_code"] == "ACCOUNT_NOT_VERIFIED"
+        assert result["valid"] is False
+        assert "error" in result
     
     @pytest.mark.asyncio
-    async def test_token_validation_valid_token(self):
-        """Test token validation with valid token."""
+    async def test_get_provider_status(self, monkeypatch, areturn, auth_service):
+        """Test provider status lookup omits credentials."""
         provider_data = {
             "provider_id": "test-id",
             "email": "test@example.com",
-            "specialization": "Cardiology",
-            "verification_status": "verified",
+            "password_hash": "hashed",
+            "verification_status": "pending",
             "is_active": True
         }
         
-        token_data = jwt_handler.generate_access_token(provider_data)
-        token = token_data["access_token"]
+        monkeypatch.setattr(auth_service.repository, "get_provider_by_email", areturn(provider_data))
         
-        auth_service = AuthService()
+        status = await auth_service.get_provider_status("test@example.com")
         
-        with patch.object(auth_service.repository, 'get_provider_by_email', return_value=provider_data):
-            result = await auth_service.validate_token(token)
-            
-            assert result["valid"] is True
-            assert result["provider_id"] == "test-id"
-            assert result["email"] == "test@example.com"
+        assert status == {
+            "email": "test@example.com",
+            "verification_status": "pending",
+            "is_active": True
+        }
     
     @pytest.mark.asyncio
-    async def test_token_validation_invalid_token(self):
-        """Test token validation with invalid token."""
-        auth_service = AuthService()
+    async def test_get_provider_status_not_found(self, monkeypatch, areturn, auth_service):
+        """Test provider status lookup for a non-existent email."""
+        monkeypatch.setattr(auth_service.repository, "get_provider_by_email", areturn(None))
         
-        result = await auth_service.validate_token("invalid.token")
+        status = await auth_service.get_provider_status("nonexistent@example.com")
         
-        assert result["valid"] is False
-        assert "error" in result
+        assert status is None
 
 class TestAuthEndpoints:
     """Test authentication API endpoints."""
     
-    def test_login_endpoint_success(self, client):
+    @pytest.mark.asyncio
+    async def test_login_endpoint_success(self, async_client, fake_auth_service):
         """Test successful login endpoint."""
-        with patch('app.api.auth_endpoints.auth_service') as mock_service:
-            mock_service.authenticate_provider.return_value = (True, {
-                "success": True,
-                "message": "Login successful",
-                "data": {
-                    "access_token": "test.jwt.token",
-                    "expires_in": 3600,
-                    "token_type": "Bearer",
-                    "provider": {
-                        "provider_id": "test-id",
-                        "email": "test@example.com",
-                        "verification_status": "verified"
-                    }
+        fake_auth_service.authenticate_provider.return_value = (True, {
+            "success": True,
+            "message": "Login successful",
+            "data": {
+                "access_token": "test.jwt.token",
+                "expires_in": 3600,
+                "token_type": "Bearer",
+                "provider": {
+                    "provider_id": "test-id",
+                    "email": "test@example.com",
+                    "verification_status": "verified"
                 }
-            })
-            
-            login_data = {
-                "email": "test@example.com",
-                "password": "SecurePassword123!"
             }
-            
-            response = client.post("/api/v1/provider/login", json=login_data)
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert "access_token" in data["data"]
+        })
+        
+        response = await async_client.post("/api/v1/provider/login", content=_LOGIN_BODY, headers=JSON_HEADERS)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert "access_token" in data["data"]
     
-    def test_login_endpoint_invalid_credentials(self, client):
+    @pytest.mark.asyncio
+    async def test_login_endpoint_invalid_credentials(self, async_client, fake_auth_service):
         """Test login endpoint with invalid credentials."""
-        with patch('app.api.auth_endpoints.auth_service') as mock_service:
-            mock_service.authenticate_provider.return_value = (False, {
-                "success": False,
-                "message": "Invalid credentials",
-                "error_code": "INVALID_CREDENTIALS"
-            })
-            
-            login_data = {
-                "email": "test@example.com",
-                "password": "wrongpassword"
-            }
-            
-            response = client.post("/api/v1/provider/login", json=login_data)
-            
-            assert response.status_code == 401
-            data = response.json()
-            assert data["success"] is False
-            assert data["error_code"] == "INVALID_CREDENTIALS"
+        fake_auth_service.authenticate_provider.return_value = (False, {
+            "success": False,
+            "message": "Invalid credentials",
+            "error_code": "INVALID_CREDENTIALS"
+        })
+        
+        response = await async_client.post("/api/v1/provider/login", content=_WRONG_PASSWORD_LOGIN_BODY, headers=JSON_HEADERS)
+        
+        assert response.status_code == 401
+        data = response.json()
+        assert data["success"] is False
+        assert data["error_code"] == "INVALID_CREDENTIALS"
     
-    def test_login_endpoint_validation_error(self, client):
+    @pytest.mark.asyncio
+    async def test_login_endpoint_validation_error(self, async_client):
         """Test login endpoint with validation errors."""
-        invalid_data = {
-            "email": "invalid-email",
-            "password": ""
-        }
-        
-        response = client.post("/api/v1/provider/login", json=invalid_data)
+        response = await async_client.post("/api/v1/provider/login", content=_INVALID_LOGIN_BODY, headers=JSON_HEADERS)
         
         assert response.status_code == 422
         data = response.json()
         assert data["success"] is False
         assert "errors" in data
     
-    def test_verify_token_endpoint(self, client):
+    @pytest.mark.asyncio
+    async def test_verify_token_endpoint(self, async_client, authenticated_provider):
         """Test token verification endpoint."""
-        with patch('app.api.auth_endpoints.get_optional_current_provider') as mock_dep:
-            mock_dep.return_value = {
-                "provider_id": "test-id",
-                "email": "test@example.com",
-                "verification_status": "verified",
-                "is_active": True
-            }
-            
-            response = client.get("/api/v1/provider/verify-token")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["valid"] is True
+        response = await async_client.get("/api/v1/provider/verify-token")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["valid"] is True
+        assert data["provider_id"] == authenticated_provider["provider_id"]
     
-    def test_me_endpoint_authenticated(self, client):
+    @pytest.mark.asyncio
+    async def test_me_endpoint_authenticated(self, async_client, authenticated_provider):
         """Test /me endpoint with authentication."""
-        with patch('app.api.auth_endpoints.get_current_provider') as mock_dep:
-            mock_dep.return_value = {
-                "provider_id": "test-id",
-                "email": "test@example.com",
-                "first_name": "John",
-                "last_name": "Doe"
-            }
-            
-            response = client.get("/api/v1/provider/me")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert data["data"]["email"] == "test@example.com"
+        response = await async_client.get("/api/v1/provider/me")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["email"] == "test@example.com"
     
-    def test_logout_endpoint(self, client):
+    @pytest.mark.asyncio
+    async def test_logout_endpoint(self, async_client, authenticated_provider):
         """Test logout endpoint."""
-        with patch('app.api.auth_endpoints.get_current_provider') as mock_dep:
-            mock_dep.return_value = {
-                "provider_id": "test-id",
-                "email": "test@example.com"
-            }
-            
-            response = client.post("/api/v1/provider/logout")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert data["message"] == "Logout successful" 
\ No newline at end of file
+        response = await async_client.post("/api/v1/provider/logout")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["message"] == "Logout successful"
\ No newline at end of file
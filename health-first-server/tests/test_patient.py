@@ -1,40 +1,43 @@
 import pytest
 from datetime import date, datetime
+from types import MappingProxyType
 from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
 import json
+import orjson
 
 from app.schemas.patient import PatientRegistrationSchema, Gender, AddressSchema
 from app.services.patient_service import PatientService
 from app.utils.security import hash_password, verify_password
 from main import app
 
-# Test client
-client = TestClient(app)
+# Test client; its portal thread runs the app on uvloop
+client = TestClient(app, backend_options={"use_uvloop": True})
+
+# Valid registration payload; tests override single fields in a fresh dict
+_BASE_PATIENT_DATA = MappingProxyType({
+    "first_name": "Jane",
+    "last_name": "Smith",
+    "email": "jane.smith@email.com",
+    "phone_number": "+12125551234",
+    "password": "SecurePassword123!",
+    "confirm_password": "SecurePassword123!",
+    "date_of_birth": "1990-05-15",
+    "gender": "female",
+    "address": {
+        "street": "456 Main Street",
+        "city": "Boston",
+        "state": "MA",
+        "zip": "02101"
+    }
+})
 
 class TestPatientValidation:
     """Test patient schema validation."""
     
     def test_valid_patient_registration_schema(self):
         """Test valid patient registration data."""
-        valid_data = {
-            "first_name": "Jane",
-            "last_name": "Smith",
-            "email": "jane.smith@email.com",
-            "phone_number": "+12125551234",
-            "password": "SecurePassword123!",
-            "confirm_password": "SecurePassword123!",
-            "date_of_birth": "1990-05-15",
-            "gender": "female",
-            "address": {
-                "street": "456 Main Street",
-                "city": "Boston",
-                "state": "MA",
-                "zip": "02101"
-            }
-        }
-        
-        schema = PatientRegistrationSchema(**valid_data)
+        schema = PatientRegistrationSchema.model_validate({**_BASE_PATIENT_DATA})
         assert schema.first_name == "Jane"
         assert schema.last_name == "Smith"
         assert schema.email == "jane.smith@email.com"
@@ -66,85 +69,33 @@ class TestPatientValidation:
                 }
             )
     
-    def test_password_strength_validation(self):
+    @pytest.mark.parametrize("password", [
+        "weak",
+        "weakpassword123!",
+        "WeakPassword123"
+    ], ids=["too_weak", "no_uppercase", "no_special_character"])
+    def test_password_strength_validation(self, password):
         """Test password strength requirements."""
-        base_data = {
-            "first_name": "Jane",
-            "last_name": "Smith",
-            "email": "jane.smith@email.com",
-            "phone_number": "+12125551234",
-            "confirm_password": "weak",
-            "date_of_birth": "1990-05-15",
-            "gender": "female",
-            "address": {
-                "street": "456 Main Street",
-                "city": "Boston",
-                "state": "MA",
-                "zip": "02101"
-            }
-        }
-        
-        # Test weak password
-        with pytest.raises(ValueError):
-            PatientRegistrationSchema(**{**base_data, "password": "weak"})
-        
-        # Test password without uppercase
         with pytest.raises(ValueError):
-            PatientRegistrationSchema(**{**base_data, "password": "weakpassword123!"})
-        
-        # Test password without special character
-        with pytest.raises(ValueError):
-            PatientRegistrationSchema(**{**base_data, "password": "WeakPassword123"})
+            PatientRegistrationSchema.model_validate(
+                {**_BASE_PATIENT_DATA, "password": password, "confirm_password": password}
+            )
     
     def test_phone_number_validation(self):
         """Test phone number format validation."""
-        base_data = {
-            "first_name": "Jane",
-            "last_name": "Smith",
-            "email": "jane.smith@email.com",
-            "password": "SecurePassword123!",
-            "confirm_password": "SecurePassword123!",
-            "date_of_birth": "1990-05-15",
-            "gender": "female",
-            "address": {
-                "street": "456 Main Street",
-                "city": "Boston",
-                "state": "MA",
-                "zip": "02101"
-            }
-        }
-        
         # Test invalid phone number
         with pytest.raises(ValueError, match="Invalid phone number format"):
-            PatientRegistrationSchema(**{**base_data, "phone_number": "1234567890"})
+            PatientRegistrationSchema.model_validate({**_BASE_PATIENT_DATA, "phone_number": "1234567890"})
         
         # Test valid phone number
-        schema = PatientRegistrationSchema(**{**base_data, "phone_number": "+12125551234"})
+        schema = PatientRegistrationSchema.model_validate({**_BASE_PATIENT_DATA, "phone_number": "+12125551234"})
         assert schema.phone_number == "+12125551234"
     
-    def test_gender_enum_validation(self):
+    @pytest.mark.parametrize("gender", ["male", "female", "other", "prefer_not_to_say"])
+    def test_gender_enum_validation(self, gender):
         """Test gender enum validation."""
-        valid_genders = ["male", "female", "other", "prefer_not_to_say"]
-        
-        for gender in valid_genders:
-            data = {
-                "first_name": "Test",
-                "last_name": "User",
-                "email": "test@email.com",
-                "phone_number": "+12125551234",
-                "password": "SecurePassword123!",
-                "confirm_password": "SecurePassword123!",
-                "date_of_birth": "1990-05-15",
-                "gender": gender,
-                "address": {
-                    "street": "123 Test St",
-                    "city": "Test City",
-                    "state": "TS",
-                    "zip": "12345"
-                }
-            }
-            schema = PatientRegistrationSchema(**data)
-            assert schema.gender.value == gender
+        schema = PatientRegistrationSchema.model_validate({**_BASE_PATIENT_DATA, "gender": gender})
+        assert schema.gender.value == gender
 
 class TestPatientService:
     """Test patient service business logic."""
@@ -176,7 +127,7 @@ class TestPatientService:
             confirm_password="SecurePassword123!",
             date_of_birth="1990-05-15",
             gender="female",
-            address=AddressSchema(
+            address=AddressSchema.model_construct(
                 street="456 Main Street",
                 city="Boston",
                 state="MA",
@@ -189,7 +140,7 @@ class TestPatientService:
         assert success is True
         assert response["success"] is True
         assert response["data"]["email"] == "jane.smith@email.com"
-        assert "password" not in str(response)  # Ensure no password in response
+        assert b"password" not in orjson.dumps(response)  # Ensure no password in response
     
     @pytest.mark.asyncio
     async def test_duplicate_email_registration(self):
@@ -209,7 +160,7 @@ class TestPatientService:
             confirm_password="SecurePassword123!",
             date_of_birth="1990-05-15",
             gender="female",
-            address=AddressSchema(
+            address=AddressSchema.model_construct(
                 street="456 Main Street",
                 city="Boston",
                 state="MA",
@@ -286,12 +237,8 @@ class TestPatientAPI:
         assert "is_valid" in data
         assert "errors" in data
     
-    def test_api_docs_include_patient_endpoints(self):
+    def test_api_docs_include_patient_endpoints(self, openapi_spec):
         """Test that API documentation includes patient endpoints."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        openapi_spec = response.json()
-        
         # Check that patient endpoints are included
         paths = openapi_spec.get("paths", {})
         assert "/api/v1/patient/register" in paths
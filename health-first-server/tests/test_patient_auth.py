@@ -1,5 +1,4 @@
 import pytest
-import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone, timedelta
 from fastapi.testclient import TestClient
@@ -7,62 +6,85 @@ from fastapi import HTTPException, status
 import jwt
 
 from app.services.patient_auth_service import PatientAuthService
+from app.services.patient_repository import PatientRepositoryInterface
 from app.schemas.auth import PatientLoginSchema
 from app.utils.jwt_handler import jwt_handler
 from app.middleware.auth_middleware import get_current_patient
 from main import app
 
+# Fixed timestamps keep the shared patient fixtures identical across tests
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Stored hash of "password123" shared by the sample patients
+_SAMPLE_PATIENT_HASH = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewrBkOxK2cDamN/."
+
+@pytest.fixture(scope="module")
+def sample_patient():
+    """Sample patient data for testing (shared by the module; copy before modifying)."""
+    return {
+        "patient_id": "test-patient-123",
+        "email": "jane.smith@email.com",
+        "first_name": "Jane",
+        "last_name": "Smith",
+        "password_hash": _SAMPLE_PATIENT_HASH,
+        "date_of_birth": "1990-05-15",
+        "gender": "female",
+        "phone_number": "+1234567890",
+        "address": {
+            "street": "123 Main St",
+            "city": "Anytown", 
+            "state": "CA",
+            "zip": "12345"
+        },
+        "email_verified": True,
+        "phone_verified": False,
+        "is_active": True,
+        "created_at": _FIXED_TS,
+        "updated_at": _FIXED_TS
+    }
+
+@pytest.fixture(scope="module")
+def inactive_patient(sample_patient):
+    """sample_patient with a deactivated account, built once per module."""
+    return {**sample_patient, "is_active": False}
+
 class TestPatientAuthService:
     """Test suite for PatientAuthService functionality."""
 
-    @pytest_asyncio.fixture
-    async def mock_repository(self):
-        """Mock patient repository for testing."""
-        mock_repo = AsyncMock()
+    @pytest.fixture
+    def mock_repository(self):
+        """Mock patient repository for testing, limited to the repository interface."""
+        mock_repo = AsyncMock(spec=PatientRepositoryInterface)
         return mock_repo
 
-    @pytest_asyncio.fixture 
-    async def auth_service(self, mock_repository):
+    @pytest.fixture
+    def auth_service(self, mock_repository):
         """Create PatientAuthService instance with mocked repository."""
         with patch('app.services.patient_auth_service.get_patient_repository', return_value=mock_repository):
             service = PatientAuthService()
             service.repository = mock_repository
             return service
 
-    @pytest_asyncio.fixture
-    async def sample_patient(self):
-        """Sample patient data for testing."""
-        return {
-            "patient_id": "test-patient-123",
-            "email": "jane.smith@email.com",
-            "first_name": "Jane",
-            "last_name": "Smith",
-            "password_hash": "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewrBkOxK2cDamN/.",  # "password123"
-            "date_of_birth": "1990-05-15",
-            "gender": "female",
-            "phone_number": "+1234567890",
-            "address": {
-                "street": "123 Main St",
-                "city": "Anytown", 
-                "state": "CA",
-                "zip": "12345"
-            },
-            "email_verified": True,
-            "phone_verified": False,
-            "is_active": True,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        }
+    @pytest.fixture
+    def auth_service_nomock(self):
+        """PatientAuthService without a repository, for token checks that fail before any lookup."""
+        return PatientAuthService.__new__(PatientAuthService)
+
+    @pytest.fixture
+    def verify_password_mock(self, monkeypatch):
+        """Stub password verification; accepts by default, set return_value to reject."""
+        mock_verify = MagicMock(return_value=True)
+        monkeypatch.setattr('app.services.patient_auth_service.verify_password', mock_verify)
+        return mock_verify
 
     @pytest.mark.asyncio
-    async def test_authenticate_patient_success(self, auth_service, mock_repository, sample_patient):
+    async def test_authenticate_patient_success(self, auth_service, mock_repository, sample_patient, verify_password_mock):
         """Test successful patient authentication."""
         # Arrange
         login_data = PatientLoginSchema(email="jane.smith@email.com", password="password123")
         mock_repository.get_patient_by_email.return_value = sample_patient
 
-        with patch('app.services.patient_auth_service.verify_password', return_value=True), \
-             patch('app.utils.jwt_handler.jwt_handler.generate_patient_access_token') as mock_jwt:
+        with patch('app.utils.jwt_handler.jwt_handler.generate_patient_access_token') as mock_jwt:
             
             mock_jwt.return_value = {
                 "access_token": "test-token",
@@ -97,37 +119,35 @@ class TestPatientAuthService:
         assert response_data["error_code"] == "INVALID_CREDENTIALS"
 
     @pytest.mark.asyncio
-    async def test_authenticate_patient_invalid_password(self, auth_service, mock_repository, sample_patient):
+    async def test_authenticate_patient_invalid_password(self, auth_service, mock_repository, sample_patient, verify_password_mock):
         """Test authentication with invalid password."""
         # Arrange
         login_data = PatientLoginSchema(email="jane.smith@email.com", password="wrongpassword")
         mock_repository.get_patient_by_email.return_value = sample_patient
+        verify_password_mock.return_value = False
 
-        with patch('app.services.patient_auth_service.verify_password', return_value=False):
-            # Act
-            success, response_data = await auth_service.authenticate_patient(login_data)
+        # Act
+        success, response_data = await auth_service.authenticate_patient(login_data)
 
-            # Assert
-            assert success is False
-            assert response_data["success"] is False
-            assert response_data["error_code"] == "INVALID_CREDENTIALS"
+        # Assert
+        assert success is False
+        assert response_data["success"] is False
+        assert response_data["error_code"] == "INVALID_CREDENTIALS"
 
     @pytest.mark.asyncio
-    async def test_authenticate_patient_inactive_account(self, auth_service, mock_repository, sample_patient):
+    async def test_authenticate_patient_inactive_account(self, auth_service, mock_repository, inactive_patient, verify_password_mock):
         """Test authentication with inactive account."""
         # Arrange
         login_data = PatientLoginSchema(email="jane.smith@email.com", password="password123")
-        sample_patient["is_active"] = False
-        mock_repository.get_patient_by_email.return_value = sample_patient
+        mock_repository.get_patient_by_email.return_value = inactive_patient
 
-        with patch('app.services.patient_auth_service.verify_password', return_value=True):
-            # Act
-            success, response_data = await auth_service.authenticate_patient(login_data)
+        # Act
+        success, response_data = await auth_service.authenticate_patient(login_data)
 
-            # Assert
-            assert success is False
-            assert response_data["success"] is False
-            assert response_data["error_code"] == "ACCOUNT_DEACTIVATED"
+        # Assert
+        assert success is False
+        assert response_data["success"] is False
+        assert response_data["error_code"] == "ACCOUNT_DEACTIVATED"
 
     @pytest.mark.asyncio
     async def test_validate_token_success(self, auth_service, mock_repository, sample_patient):
@@ -156,21 +176,21 @@ class TestPatientAuthService:
             assert result["email"] == "jane.smith@email.com"
 
     @pytest.mark.asyncio
-    async def test_validate_token_invalid(self, auth_service):
+    async def test_validate_token_invalid(self, auth_service_nomock):
         """Test token validation with invalid token."""
         # Arrange
         invalid_token = "invalid-jwt-token"
 
         with patch('app.utils.jwt_handler.jwt_handler.verify_access_token', return_value=None):
             # Act
-            result = await auth_service.validate_token(invalid_token)
+            result = await auth_service_nomock.validate_token(invalid_token)
 
             # Assert
             assert result["valid"] is False
             assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_validate_token_wrong_role(self, auth_service):
+    async def test_validate_token_wrong_role(self, auth_service_nomock):
         """Test token validation with provider token (wrong role)."""
         # Arrange
         provider_token = "provider-jwt-token"
@@ -184,7 +204,7 @@ class TestPatientAuthService:
 
         with patch('app.utils.jwt_handler.jwt_handler.verify_access_token', return_value=mock_payload):
             # Act
-            result = await auth_service.validate_token(provider_token)
+            result = await auth_service_nomock.validate_token(provider_token)
 
             # Assert
             assert result["valid"] is False
@@ -279,10 +299,10 @@ class TestJWTHandler:
 class TestPatientAuthEndpoints:
     """Test suite for patient authentication endpoints."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def client(self):
-        """Create test client."""
-        return TestClient(app)
+        """Create one test client for the endpoint tests in this module, served on uvloop."""
+        return TestClient(app, backend_options={"use_uvloop": True})
 
     @pytest.fixture
     def valid_login_data(self):
@@ -292,23 +312,23 @@ class TestPatientAuthEndpoints:
             "password": "password123"
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_patient_for_endpoint(self):
-        """Sample patient data for endpoint testing."""
+        """Sample patient data for endpoint testing (shared by the module; copy before modifying)."""
         return {
             "patient_id": "test-patient-123",
             "email": "jane.smith@email.com",
             "first_name": "Jane",
             "last_name": "Smith",
-            "password_hash": "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewrBkOxK2cDamN/.",
+            "password_hash": _SAMPLE_PATIENT_HASH,
             "date_of_birth": "1990-05-15",
             "gender": "female",
             "phone_number": "+1234567890",
             "email_verified": True,
             "phone_verified": False,
             "is_active": True,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
+            "created_at": _FIXED_TS,
+            "updated_at": _FIXED_TS
         }
 
     def test_patient_login_success(self, client, valid_login_data, sample_patient_for_endpoint):
@@ -423,15 +443,14 @@ class TestPatientAuthMiddleware:
     @pytest.mark.asyncio
     async def test_get_current_patient_success(self, mock_credentials, sample_patient):
         """Test successful patient authentication middleware."""
-        with patch('app.services.patient_auth_service.PatientAuthService.validate_token') as mock_validate, \
-             patch('app.services.patient_auth_service.PatientAuthService.get_current_patient') as mock_get_patient:
-            
-            mock_validate.return_value = {
+        with patch.multiple(
+            'app.services.patient_auth_service.PatientAuthService',
+            validate_token=AsyncMock(return_value={
                 "valid": True,
                 "patient_id": "test-patient-123"
-            }
-            mock_get_patient.return_value = sample_patient
-
+            }),
+            get_current_patient=AsyncMock(return_value=sample_patient)
+        ):
             from app.middleware.auth_middleware import AuthMiddleware
             middleware = AuthMiddleware()
 
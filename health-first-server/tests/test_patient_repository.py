@@ -0,0 +1,96 @@
+import pytest
+from datetime import date
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+
+from app.models.sql_models import Patient
+from app.services import patient_repository
+from app.services.patient_repository import MongoPatientRepository, SQLPatientRepository
+
+def _patient_data(email: str = "jane.smith@example.com", phone_number: str = "+12125551234") -> Dict[str, Any]:
+    """Build the patient data the service passes to upsert_patient."""
+    return {
+        "first_name": "Jane",
+        "last_name": "Smith",
+        "email": email,
+        "phone_number": phone_number,
+        "password_hash": "not-a-real-hash",
+        "date_of_birth": date(1990, 5, 15),
+        "gender": "female",
+        "address": {
+            "street": "456 Main Street",
+            "city": "Boston",
+            "state": "MA",
+            "zip": "02101"
+        }
+    }
+
+@pytest.fixture
+def sqlite_repository(sqlite_db_manager, monkeypatch) -> SQLPatientRepository:
+    """SQL patient repository backed by an empty SQLite database."""
+    monkeypatch.setattr(patient_repository, "db_manager", sqlite_db_manager)
+    return SQLPatientRepository()
+
+@pytest.fixture
+def patients_collection(monkeypatch) -> MagicMock:
+    """Mock patients collection served to the Mongo repository."""
+    collection = MagicMock()
+    fake_db_manager = MagicMock()
+    fake_db_manager.get_mongo_collection.return_value = collection
+    monkeypatch.setattr(patient_repository, "db_manager", fake_db_manager)
+    return collection
+
+class TestSQLUpsertPatient:
+    """Test the single-statement patient upsert against a real SQLite database."""
+    
+    @pytest.mark.asyncio
+    async def test_creates_patient(self, sqlite_repository, sqlite_db_manager):
+        """A new email is inserted and its integer ID returned."""
+        patient_id = await sqlite_repository.upsert_patient(_patient_data())
+        
+        assert isinstance(patient_id, int)
+        with sqlite_db_manager.get_read_session() as session:
+            assert session.query(Patient).filter(Patient.id == patient_id).one().email == "jane.smith@example.com"
+    
+    @pytest.mark.asyncio
+    async def test_existing_email_is_skipped(self, sqlite_repository, sqlite_db_manager):
+        """A second upsert for the same email returns None and leaves the first row alone."""
+        patient_id = await sqlite_repository.upsert_patient(_patient_data())
+        
+        assert await sqlite_repository.upsert_patient(_patient_data(phone_number="+12125559999")) is None
+        with sqlite_db_manager.get_read_session() as session:
+            assert [patient.id for patient in session.query(Patient)] == [patient_id]
+    
+    @pytest.mark.asyncio
+    async def test_new_email_with_existing_phone_fails(self, sqlite_repository):
+        """Only the email is treated as already registered; any other duplicate key is an error."""
+        await sqlite_repository.upsert_patient(_patient_data())
+        
+        with pytest.raises(RuntimeError):
+            await sqlite_repository.upsert_patient(_patient_data(email="someone.else@example.com"))
+
+class TestMongoUpsertPatient:
+    """Test the Mongo patient upsert against a mock collection."""
+    
+    @pytest.mark.asyncio
+    async def test_creates_patient(self, patients_collection):
+        """An upserted document's ID is returned as a string."""
+        inserted_id = ObjectId()
+        patients_collection.update_one.return_value.upserted_id = inserted_id
+        
+        patient_id = await MongoPatientRepository().upsert_patient(_patient_data())
+        
+        assert patient_id == str(inserted_id)
+        filter_document, update_document = patients_collection.update_one.call_args.args
+        assert filter_document == {"email": "jane.smith@example.com"}
+        assert update_document["$setOnInsert"]["email"] == "jane.smith@example.com"
+        assert patients_collection.update_one.call_args.kwargs == {"upsert": True}
+    
+    @pytest.mark.asyncio
+    async def test_existing_email_is_skipped(self, patients_collection):
+        """Nothing is upserted when the email already exists."""
+        patients_collection.update_one.return_value.upserted_id = None
+        
+        assert await MongoPatientRepository().upsert_patient(_patient_data()) is None
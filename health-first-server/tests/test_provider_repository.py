@@ -0,0 +1,101 @@
+import pytest
+import pytest_asyncio
+from typing import Any, Dict, List
+
+import normalize_provider_emails
+from app.services import provider_repository
+from app.services.provider_repository import SQLProviderRepository
+
+def _provider_data(index: int) -> Dict[str, Any]:
+    """Build registration data whose email, phone and license all differ per index."""
+    return {
+        "first_name": "Test",
+        "last_name": f"Provider{index}",
+        "email": f"provider{index}@example.com",
+        "phone_number": f"+1555000000{index}",
+        "password_hash": "not-a-real-hash",
+        "specialization": "Cardiology",
+        "license_number": f"LIC00{index}",
+        "years_of_experience": 5,
+        "clinic_address": {
+            "street": "1 Test Street",
+            "city": "Testville",
+            "state": "CA",
+            "zip": "90001"
+        }
+    }
+
+@pytest.fixture
+def sqlite_repository(sqlite_db_manager, monkeypatch) -> SQLProviderRepository:
+    """SQL provider repository backed by an empty SQLite database."""
+    monkeypatch.setattr(provider_repository, "db_manager", sqlite_db_manager)
+    return SQLProviderRepository()
+
+@pytest_asyncio.fixture
+async def stored_providers(sqlite_repository) -> List[Dict[str, Any]]:
+    """Two providers stored through the repository."""
+    return [await sqlite_repository.create_provider(_provider_data(index)) for index in (1, 2)]
+
+class TestSQLGetProviderByUniqueFields:
+    """Test the combined uniqueness lookup against a real SQLite database."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("field", ["email", "phone_number", "license_number"])
+    async def test_match_on_single_field(self, sqlite_repository, stored_providers, field):
+        """Each field matches on its own and leaves the other fields unmatched."""
+        matches = await sqlite_repository.get_provider_by_unique_fields(**{field: stored_providers[0][field]})
+        
+        assert matches[field]["provider_id"] == stored_providers[0]["provider_id"]
+        assert [name for name, provider in matches.items() if provider is not None] == [field]
+    
+    @pytest.mark.asyncio
+    async def test_one_provider_matching_several_fields(self, sqlite_repository, stored_providers):
+        """A provider holding every value is reported for every field."""
+        provider = stored_providers[1]
+        
+        matches = await sqlite_repository.get_provider_by_unique_fields(
+            email=provider["email"],
+            phone_number=provider["phone_number"],
+            license_number=provider["license_number"]
+        )
+        
+        assert {field: match["provider_id"] for field, match in matches.items()} == {
+            "email": provider["provider_id"],
+            "phone_number": provider["provider_id"],
+            "license_number": provider["provider_id"]
+        }
+    
+    @pytest.mark.asyncio
+    async def test_different_providers_matching_different_fields(self, sqlite_repository, stored_providers):
+        """Each field is mapped to the provider that actually holds its value."""
+        first, second = stored_providers
+        
+        matches = await sqlite_repository.get_provider_by_unique_fields(
+            email=first["email"],
+            phone_number=second["phone_number"],
+            license_number="LIC999"
+        )
+        
+        assert matches["email"]["provider_id"] == first["provider_id"]
+        assert matches["phone_number"]["provider_id"] == second["provider_id"]
+        assert matches["license_number"] is None
+    
+    @pytest.mark.asyncio
+    async def test_no_arguments(self, sqlite_repository, stored_providers):
+        """Without any values to look up nothing matches."""
+        matches = await sqlite_repository.get_provider_by_unique_fields()
+        
+        assert matches == {"email": None, "phone_number": None, "license_number": None}
+    
+    @pytest.mark.asyncio
+    async def test_mixed_case_email_found_after_normalization(self, sqlite_repository, sqlite_db_manager, monkeypatch):
+        """Emails stored before normalization are found by lookup and login once lowercased."""
+        provider = await sqlite_repository.create_provider({**_provider_data(3), "email": "Mixed.Case@Example.com"})
+        monkeypatch.setattr(normalize_provider_emails, "db_manager", sqlite_db_manager)
+        
+        assert normalize_provider_emails._normalize_sql_emails() == 1
+        
+        matches = await sqlite_repository.get_provider_by_unique_fields(email="mixed.case@example.com")
+        assert matches["email"]["provider_id"] == provider["provider_id"]
+        login_provider = await sqlite_repository.get_provider_by_email("mixed.case@example.com")
+        assert login_provider["provider_id"] == provider["provider_id"]
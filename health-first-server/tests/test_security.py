@@ -1,56 +1,64 @@
+import bcrypt
 import pytest
+from app.middleware.cors_middleware import AllowListCORSMiddleware
 from app.utils.security import hash_password, verify_password, validate_password_strength
 
+@pytest.fixture(scope="class")
+def secure_password_hash():
+    """Argon2id hash of "SecurePassword123!", computed once per test class."""
+    return hash_password("SecurePassword123!")
+
 class TestPasswordHashing:
     """Test password hashing and verification."""
     
-    def test_password_hashing(self):
+    def test_password_hashing(self, secure_password_hash):
         """Test that passwords are properly hashed."""
         password = "SecurePassword123!"
-        hashed = hash_password(password)
+        hashed = secure_password_hash
         
         # Verify hash is not the original password
         assert hashed != password
         
-        # Verify hash starts with bcrypt identifier
-        assert hashed.startswith("$2b$")
-        
-        # Verify hash is consistent length (bcrypt hashes are 60 characters)
-        assert len(hashed) == 60
+        # Verify hash is an encoded Argon2id hash
+        assert hashed.startswith("$argon2id$v=19$")
     
-    def test_password_verification_success(self):
+    def test_password_verification_success(self, secure_password_hash):
         """Test successful password verification."""
         password = "SecurePassword123!"
-        hashed = hash_password(password)
+        hashed = secure_password_hash
         
         # Verify correct password
         assert verify_password(password, hashed) is True
     
-    def test_password_verification_failure(self):
+    def test_password_verification_failure(self, secure_password_hash):
         """Test failed password verification."""
-        password = "SecurePassword123!"
         wrong_password = "WrongPassword123!"
-        hashed = hash_password(password)
         
         # Verify wrong password fails
-        assert verify_password(wrong_password, hashed) is False
+        assert verify_password(wrong_password, secure_password_hash) is False
     
-    def test_different_passwords_different_hashes(self):
+    def test_different_passwords_different_hashes(self, secure_password_hash):
         """Test that different passwords produce different hashes."""
-        password1 = "SecurePassword123!"
         password2 = "DifferentPassword456@"
         
-        hash1 = hash_password(password1)
+        hash1 = secure_password_hash
         hash2 = hash_password(password2)
         
         # Different passwords should have different hashes
         assert hash1 != hash2
     
-    def test_same_password_different_salts(self):
+    def test_legacy_bcrypt_hash_verification(self):
+        """Test that bcrypt hashes stored before the Argon2id switch still verify."""
+        legacy_hash = bcrypt.hashpw(b"SecurePassword123!", bcrypt.gensalt(rounds=4)).decode('utf-8')
+        
+        assert verify_password("SecurePassword123!", legacy_hash) is True
+        assert verify_password("WrongPassword123!", legacy_hash) is False
+    
+    def test_same_password_different_salts(self, secure_password_hash):
         """Test that the same password produces different hashes due to salting."""
         password = "SecurePassword123!"
         
-        hash1 = hash_password(password)
+        hash1 = secure_password_hash
         hash2 = hash_password(password)
         
         # Same password should have different hashes due to random salt
@@ -129,40 +137,64 @@ class TestPasswordStrength:
             is_valid, errors = validate_password_strength(password)
             assert is_valid, f"Password with '{char}' should be valid"
     
-    def test_comprehensive_weak_passwords(self):
+    @pytest.mark.parametrize("password", [
+        "12345678",           # Only digits
+        "password",           # Only lowercase
+        "PASSWORD",           # Only uppercase
+        "Password",           # Missing digit and special char
+        "Password123",        # Missing special char
+        "Password!",          # Missing digit
+        "pass123!",           # Missing uppercase
+        "PASS123!",           # Missing lowercase
+        "",                   # Empty
+        "P@1",                # Too short but has all types
+    ])
+    def test_comprehensive_weak_passwords(self, password):
         """Test various weak password patterns."""
-        weak_passwords = [
-            "12345678",           # Only digits
-            "password",           # Only lowercase
-            "PASSWORD",           # Only uppercase
-            "Password",           # Missing digit and special char
-            "Password123",        # Missing special char
-            "Password!",          # Missing digit
-            "pass123!",           # Missing uppercase
-            "PASS123!",           # Missing lowercase
-            "",                   # Empty
-            "P@1",                # Too short but has all types
-        ]
-        
-        for password in weak_passwords:
-            is_valid, errors = validate_password_strength(password)
-            assert not is_valid, f"Password '{password}' should be invalid"
-            assert len(errors) > 0, f"Password '{password}' should have error messages"
+        is_valid, errors = validate_password_strength(password)
+        assert not is_valid, f"Password '{password}' should be invalid"
+        assert len(errors) > 0, f"Password '{password}' should have error messages"
     
-    def test_comprehensive_strong_passwords(self):
+    @pytest.mark.parametrize("password", [
+        "SecurePass123!",
+        "MyStr0ng#P@ssw0rd",
+        "Complex@Password1",
+        "Valid123$Password",
+        "Tr0ub4dor&3",
+        "xkcd927!Correct",
+        "P@ssw0rd2024!",
+        "MyC0mplex#Pass"
+    ])
+    def test_comprehensive_strong_passwords(self, password):
         """Test various strong password patterns."""
-        strong_passwords = [
-            "SecurePass123!",
-            "MyStr0ng#P@ssw0rd",
-            "Complex@Password1",
-            "Valid123$Password",
-            "Tr0ub4dor&3",
-            "xkcd927!Correct",
-            "P@ssw0rd2024!",
-            "MyC0mplex#Pass"
-        ]
-        
-        for password in strong_passwords:
-            is_valid, errors = validate_password_strength(password)
-            assert is_valid, f"Password '{password}' should be valid, but got errors: {errors}"
-            assert len(errors) == 0, f"Strong password should have no errors: {errors}" 
\ No newline at end of file
+        is_valid, errors = validate_password_strength(password)
+        assert is_valid, f"Password '{password}' should be valid, but got errors: {errors}"
+        assert len(errors) == 0, f"Strong password should have no errors: {errors}"
+
+class TestAllowListCORSMiddleware:
+    """Test origin checks in the allow-list CORS middleware."""
+    
+    def test_listed_origin_is_case_insensitive(self):
+        """Test that listed origins match regardless of case."""
+        middleware = AllowListCORSMiddleware(None, allow_origins=["http://localhost:3000"])
+        
+        assert middleware.is_allowed_origin("http://localhost:3000")
+        assert middleware.is_allowed_origin("HTTP://LocalHost:3000")
+        assert not middleware.is_allowed_origin("http://evil.example.com")
+    
+    def test_origin_regex_is_honored(self):
+        """Test that allow_origin_regex still admits matching origins."""
+        middleware = AllowListCORSMiddleware(
+            None,
+            allow_origins=["http://localhost:3000"],
+            allow_origin_regex=r"https://.*\.healthfirst\.com"
+        )
+        
+        assert middleware.is_allowed_origin("https://app.healthfirst.com")
+        assert not middleware.is_allowed_origin("https://healthfirst.com.evil.example")
+    
+    def test_wildcard_allows_any_origin(self):
+        """Test that a "*" allow-list admits every origin."""
+        middleware = AllowListCORSMiddleware(None, allow_origins=["*"])
+        
+        assert middleware.is_allowed_origin("http://anything.example.com")